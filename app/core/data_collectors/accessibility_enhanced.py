@@ -3,13 +3,13 @@ Enhanced Accessibility Data Collector
 Comprehensive analysis with 10 data points across 5 categories
 """
 
-import httpx
 import asyncio
 from typing import Dict, Any, List, Tuple
 from loguru import logger
 from math import radians, sin, cos, sqrt, atan2
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class AccessibilityCollectorEnhanced:
@@ -119,7 +119,7 @@ class AccessibilityCollectorEnhanced:
             url = f"{self.base_url}/geocode/json"
             params = {"address": address, "key": self.google_api_key}
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -150,7 +150,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=15.0)
                 data = response.json()
             
@@ -179,7 +179,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(matrix_url, params=params_morning, timeout=15.0)
                 data = response.json()
             
@@ -230,7 +230,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=15.0)
                 data = response.json()
             
@@ -280,7 +280,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=15.0)
                 data = response.json()
             
@@ -367,7 +367,7 @@ class AccessibilityCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -415,7 +415,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -446,7 +446,7 @@ class AccessibilityCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(parking_url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -3,13 +3,13 @@ Enhanced Competition Data Collector
 Comprehensive analysis with 12 data points across 5 categories
 """
 
-import httpx
 import asyncio
 from typing import Dict, Any, List, Tuple
 from loguru import logger
 from math import radians, sin, cos, sqrt, atan2
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class CompetitionCollectorEnhanced:
@@ -98,7 +98,7 @@ class CompetitionCollectorEnhanced:
             logger.info(f"Geocoding address: {address}")
             logger.info(f"Using API key: {self.google_api_key[:20]}...")
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -138,7 +138,7 @@ class CompetitionCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=15.0)
                     response.raise_for_status()
                     data = response.json()
@@ -174,7 +174,7 @@ class CompetitionCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     response.raise_for_status()
                     data = response.json()
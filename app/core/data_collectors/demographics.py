@@ -3,11 +3,11 @@ Demographics Data Collector
 Collects population and demographic data using U.S. Census Bureau API and Google Geocoding
 """
 
-import httpx
 from typing import Dict, Any
 from loguru import logger
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class DemographicsCollector:
@@ -97,7 +97,7 @@ class DemographicsCollector:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -126,7 +126,7 @@ class DemographicsCollector:
                 "format": "json"
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -232,7 +232,7 @@ class DemographicsCollector:
                 "key": self.census_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=15.0)
                 
                 # Check for HTTP errors
@@ -3,12 +3,12 @@ Enhanced Economic Viability Data Collector
 Comprehensive analysis with 10 data points across 5 categories
 """
 
-import httpx
 import asyncio
 from typing import Dict, Any, List
 from loguru import logger
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class EconomicCollectorEnhanced:
@@ -122,7 +122,7 @@ class EconomicCollectorEnhanced:
             url = f"{self.base_url}/geocode/json"
             params = {"address": address, "key": self.google_api_key}
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -167,7 +167,7 @@ class EconomicCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -236,7 +236,7 @@ class EconomicCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -267,7 +267,7 @@ class EconomicCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -322,7 +322,7 @@ class EconomicCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -332,7 +332,7 @@ class EconomicCollectorEnhanced:
             params["keyword"] = "childcare|daycare|preschool"
             params.pop("type")
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -384,7 +384,7 @@ class EconomicCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -393,7 +393,7 @@ class EconomicCollectorEnhanced:
             # Check for signs of development activity
             params["keyword"] = "new construction|development|commercial building"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -442,7 +442,7 @@ class EconomicCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -460,7 +460,7 @@ class EconomicCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
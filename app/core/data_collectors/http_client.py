@@ -0,0 +1,51 @@
+"""
+Shared HTTP client for the data collectors
+One keep-alive connection pool (HTTP/2 when the h2 package is installed)
+per event loop, instead of a new client and TLS handshake per API call
+"""
+
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+import httpx
+
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# A pooled client is bound to the loop it first ran on, so scripts that call
+# asyncio.run() more than once get a fresh pool per loop
+_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's shared client, creating it on first use"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        # Drop pools left behind by loops that have since closed
+        for stale in [l for l in _clients if l.is_closed()]:
+            del _clients[stale]
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100)
+        )
+    return client
+
+
+@asynccontextmanager
+async def shared_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Drop-in for ``async with httpx.AsyncClient() as client:`` that borrows the
+    shared pool and leaves it open on exit
+    """
+    yield get_http_client()
+
+
+async def close_http_client():
+    """Close the running loop's shared client (call on application shutdown)"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
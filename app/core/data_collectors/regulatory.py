@@ -3,12 +3,12 @@ Regulatory & Zoning Data Collector
 Analysis with 8 data points across 4 categories
 """
 
-import httpx
 import asyncio
 from typing import Dict, Any, List
 from loguru import logger
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class RegulatoryCollector:
@@ -131,7 +131,7 @@ class RegulatoryCollector:
             url = f"{self.base_url}/geocode/json"
             params = {"address": address, "key": self.google_api_key}
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -157,7 +157,7 @@ class RegulatoryCollector:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -219,7 +219,7 @@ class RegulatoryCollector:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -228,7 +228,7 @@ class RegulatoryCollector:
             # Check for compatible uses (schools, community centers)
             params["keyword"] = "school|community center|library"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -237,7 +237,7 @@ class RegulatoryCollector:
             # Check for potentially conflicting uses (industrial, heavy commercial)
             params["keyword"] = "industrial|factory|warehouse|truck|manufacturing"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -332,7 +332,7 @@ class RegulatoryCollector:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -461,7 +461,7 @@ class RegulatoryCollector:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -476,7 +476,7 @@ class RegulatoryCollector:
             # Add construction activity factor (busier = longer waits)
             params["keyword"] = "construction|new development"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -4,13 +4,13 @@ Comprehensive analysis with 11 data points across 5 categories
 Now with REAL FBI Crime Data and EPA APIs!
 """
 
-import httpx
 import asyncio
 import os
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
 from app.config import get_settings
+from app.core.data_collectors.http_client import shared_client
 
 
 class SafetyCollectorEnhanced:
@@ -179,7 +179,7 @@ class SafetyCollectorEnhanced:
             url = f"{self.base_url}/geocode/json"
             params = {"address": address, "key": self.google_api_key}
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 response.raise_for_status()
                 data = response.json()
@@ -232,7 +232,7 @@ class SafetyCollectorEnhanced:
             url = f"{self.base_url}/geocode/json"
             params = {"latlng": f"{lat},{lng}", "key": self.google_api_key}
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -264,7 +264,7 @@ class SafetyCollectorEnhanced:
             violent_url = f"{self.fbi_api_base}/estimate/state/{state_fips}/violent-crime"
             property_url = f"{self.fbi_api_base}/estimate/state/{state_fips}/property-crime"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 violent_response = await client.get(violent_url, timeout=15.0)
                 property_response = await client.get(property_url, timeout=15.0)
             
@@ -327,7 +327,7 @@ class SafetyCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -346,7 +346,7 @@ class SafetyCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -412,7 +412,7 @@ class SafetyCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -443,7 +443,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(ped_url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -564,7 +564,7 @@ class SafetyCollectorEnhanced:
                 "API_KEY": self.airnow_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 
             if response.status_code == 200:
@@ -605,7 +605,7 @@ class SafetyCollectorEnhanced:
             # Query TRI_FACILITY table
             url = f"{self.epa_api_base}/TRI_FACILITY/LATITUDE/>{lat - lat_delta}/LATITUDE/<{lat + lat_delta}/LONGITUDE/>{lng - lng_delta}/LONGITUDE/<{lng + lng_delta}/JSON"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, timeout=15.0)
             
             if response.status_code == 200:
@@ -647,7 +647,7 @@ class SafetyCollectorEnhanced:
             # Query SEMS_SITE_INFO for Superfund sites
             url = f"{self.epa_api_base}/SEMS_SITE_INFO/LATITUDE/>{lat - lat_delta}/LATITUDE/<{lat + lat_delta}/LONGITUDE/>{lng - lng_delta}/LONGITUDE/<{lng + lng_delta}/JSON"
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, timeout=15.0)
             
             if response.status_code == 200:
@@ -694,7 +694,7 @@ class SafetyCollectorEnhanced:
                     "key": self.google_api_key
                 }
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -712,7 +712,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -732,7 +732,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(industrial_url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -773,7 +773,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -801,7 +801,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(water_url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -827,7 +827,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(fire_url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -869,7 +869,7 @@ class SafetyCollectorEnhanced:
                 "key": self.google_api_key
             }
             
-            async with httpx.AsyncClient() as client:
+            async with shared_client() as client:
                 response = await client.get(url, params=params, timeout=10.0)
                 data = response.json()
             
@@ -880,7 +880,7 @@ class SafetyCollectorEnhanced:
             for place_type in place_types:
                 params["type"] = place_type
                 
-                async with httpx.AsyncClient() as client:
+                async with shared_client() as client:
                     response = await client.get(url, params=params, timeout=10.0)
                     data = response.json()
                 
@@ -55,28 +55,50 @@ class PerformanceTracker:
         """
         start = time.perf_counter()
         error = None
-        success = True
         
         try:
             yield
         except Exception as e:
             error = str(e)
-            success = False
             raise
         finally:
-            end = time.perf_counter()
-            duration_ms = (end - start) * 1000  # Convert to milliseconds
-            
-            metric = TimingMetric(
-                step_name=step_name,
-                start_time=start,
-                end_time=end,
-                duration_ms=round(duration_ms, 2),
-                success=success,
-                error=error,
-                metadata=metadata
-            )
-            self.metrics.append(metric)
+            self.record(step_name, start, time.perf_counter(), error, **metadata)
+    
+    def record(self, step_name: str, start: float, end: float, error: Optional[str] = None, **metadata):
+        """
+        Record a step the caller timed itself, e.g. one task of an asyncio.gather
+        
+        Args:
+            step_name: Name of the step being tracked
+            start: time.perf_counter() when the step started
+            end: time.perf_counter() when the step finished
+            error: Error message if the step failed
+            **metadata: Additional metadata to store
+        """
+        self.metrics.append(TimingMetric(
+            step_name=step_name,
+            start_time=start,
+            end_time=end,
+            duration_ms=round((end - start) * 1000, 2),  # Convert to milliseconds
+            success=error is None,
+            error=error,
+            metadata=metadata
+        ))
+    
+    def _covered_ms(self) -> float:
+        """Wall-clock time covered by at least one step; for sequential steps
+        this is simply the sum of their durations"""
+        covered = 0.0
+        reach = None
+        for metric in sorted(self.metrics, key=lambda m: m.start_time):
+            if reach is None or metric.start_time >= reach:
+                covered += metric.duration_ms
+                reach = metric.end_time
+            elif metric.end_time > reach:
+                # Overlaps an earlier (concurrent) step; count only the new part
+                covered += (metric.end_time - reach) * 1000
+                reach = metric.end_time
+        return covered
     
     def get_total_time_ms(self) -> float:
         """Get total elapsed time since tracker creation"""
@@ -89,7 +111,7 @@ class PerformanceTracker:
         Returns:
             Dictionary with timing breakdowns and statistics
         """
-        total_tracked = sum(m.duration_ms for m in self.metrics)
+        total_tracked = self._covered_ms()
         
         # Group by category
         categories = {}
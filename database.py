@@ -3,7 +3,7 @@ SQLite Database Integration for Historical Analysis Storage
 Stores analysis results, tracks trends, enables reporting
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, Text
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, Float, DateTime, JSON, Text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
@@ -50,6 +50,12 @@ class AnalysisRecord(Base):
     status = Column(String(50), default="completed")  # completed, failed, partial
     error_message = Column(Text, nullable=True)
     
+    # History lookups filter by address or persona and list newest first
+    __table_args__ = (
+        Index("ix_analysis_records_address_created_at", "address", created_at.desc()),
+        Index("ix_analysis_records_persona_created_at", "persona", created_at.desc()),
+    )
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
@@ -90,6 +96,11 @@ class LocationTrend(Base):
     
     # Allow tracking specific metrics
     metric_type = Column(String(50), index=True)  # overall, safety, economic, etc.
+    
+    # Trend queries filter by address and metric over a date range
+    __table_args__ = (
+        Index("ix_location_trends_address_metric_recorded_at", "address", "metric_type", "recorded_at"),
+    )
 
 
 class Database:
@@ -103,13 +114,38 @@ class Database:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=False)
+        # Pooled connections are handed between the event loop and the
+        # background writer thread
+        self.engine = create_engine(
+            f"sqlite:///{db_path}",
+            echo=False,
+            connect_args={"check_same_thread": False}
+        )
+        event.listen(self.engine, "connect", self._configure_connection)
         self.Session = sessionmaker(bind=self.engine)
         
-        # Create tables
+        # Create tables; create_all skips existing tables entirely, so add
+        # indexes introduced later to databases created before them
         Base.metadata.create_all(self.engine)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
         logger.info(f"✅ Database initialized: {db_path}")
     
+    @staticmethod
+    def _configure_connection(dbapi_connection, connection_record):
+        """
+        Per-connection SQLite settings: WAL so history/trend reads don't wait
+        on saves, and synchronous=NORMAL so commits skip the extra fsync
+        (still durable against application crashes in WAL mode)
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.close()
+    
     def save_analysis(
         self,
         address: str,
@@ -127,27 +163,8 @@ class Database:
         """
         session = self.Session()
         try:
-            # Extract scores from response
-            scores = response.get("overall_scoring", {})
-            
-            record = AnalysisRecord(
-                address=address,
-                latitude=response.get("coordinates", {}).get("latitude"),
-                longitude=response.get("coordinates", {}).get("longitude"),
-                radius=response.get("search_radius", 3.0),
-                persona=persona,
-                overall_score=scores.get("overall_score"),
-                safety_score=scores.get("safety_score"),
-                economic_score=scores.get("economic_viability_score"),
-                education_score=scores.get("education_score"),
-                healthcare_score=scores.get("healthcare_score"),
-                data_points_collected=response.get("data_points_collected", 0),
-                api_calls_made=response.get("metrics", {}).get("api_calls", 0),
-                cache_hit_rate=response.get("metrics", {}).get("cache_hit_rate", 0.0),
-                execution_time_seconds=execution_time,
-                response_data=response,
-                status=status,
-                error_message=error_message
+            record = self._build_record(
+                address, response, persona, execution_time, status, error_message
             )
             
             session.add(record)
@@ -158,6 +175,7 @@ class Database:
             
             # Also save to trends
             self._save_trends(session, record)
+            session.commit()
             
             return record_id
             
@@ -168,6 +186,67 @@ class Database:
         finally:
             session.close()
     
+    def save_analyses(self, analyses: List[Dict[str, Any]]) -> List[int]:
+        """
+        Save several analyses (each given as ``save_analysis`` keyword
+        arguments) and their trends in a single transaction
+        
+        Returns:
+            Record IDs, in the same order
+        """
+        session = self.Session()
+        try:
+            records = [self._build_record(**analysis) for analysis in analyses]
+            session.add_all(records)
+            session.flush()
+            
+            for record in records:
+                self._save_trends(session, record)
+            session.commit()
+            
+            logger.info(f"💾 Saved {len(records)} analyses")
+            return [record.id for record in records]
+            
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Database save error: {e}")
+            raise
+        finally:
+            session.close()
+    
+    def _build_record(
+        self,
+        address: str,
+        response: Dict[str, Any],
+        persona: str = "business",
+        execution_time: float = 0.0,
+        status: str = "completed",
+        error_message: Optional[str] = None
+    ) -> AnalysisRecord:
+        """Build an (unsaved) analysis record from an API response"""
+        # Extract scores from response
+        scores = response.get("overall_scoring", {})
+        
+        return AnalysisRecord(
+            address=address,
+            latitude=response.get("coordinates", {}).get("latitude"),
+            longitude=response.get("coordinates", {}).get("longitude"),
+            radius=response.get("search_radius", 3.0),
+            persona=persona,
+            overall_score=scores.get("overall_score"),
+            safety_score=scores.get("safety_score"),
+            economic_score=scores.get("economic_viability_score"),
+            education_score=scores.get("education_score"),
+            healthcare_score=scores.get("healthcare_score"),
+            data_points_collected=response.get("data_points_collected", 0),
+            api_calls_made=response.get("metrics", {}).get("api_calls", 0),
+            cache_hit_rate=response.get("metrics", {}).get("cache_hit_rate", 0.0),
+            execution_time_seconds=execution_time,
+            response_data=response,
+            status=status,
+            error_message=error_message
+        )
+    
     def _save_trends(self, session, record: AnalysisRecord):
         """Save trend data for time-series analysis"""
         metrics = [
@@ -187,8 +266,6 @@ class Database:
                     metric_type=metric_type
                 )
                 session.add(trend)
-        
-        session.commit()
     
     def get_analysis_by_id(self, record_id: int) -> Optional[Dict[str, Any]]:
         """Retrieve analysis by ID"""
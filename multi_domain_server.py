@@ -3,11 +3,67 @@ Multi-Domain Location Intelligence Platform
 Single codebase supporting multiple industries
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
-from typing import Dict, Any, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional, Callable, Tuple, Awaitable
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
+from types import MappingProxyType
 import asyncio
+import gzip
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import numpy as np
+import orjson
+from cachetools import TTLCache
+from loguru import logger
+
+# Optional brotli for precompressed pages; gzip-only when absent
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Optional JIT for batch scoring kernels; NumPy fallback below when absent
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Data collectors - imported once at startup, never on the request path
+from app.core.data_collectors.demographics import DemographicsCollector
+from app.core.data_collectors.competition_enhanced import CompetitionCollectorEnhanced
+from app.core.data_collectors.accessibility_enhanced import AccessibilityCollectorEnhanced
+from app.core.data_collectors.safety_enhanced import SafetyCollectorEnhanced
+from app.core.data_collectors.economic_enhanced import EconomicCollectorEnhanced
+from app.core.data_collectors.regulatory import RegulatoryCollector
+from app.core.data_collectors.tiles.demographics import TilesDemographicsCollector
+from app.core.data_collectors.tiles.competition import TilesCompetitionCollector
+from app.core.data_collectors.tiles.accessibility import TilesAccessibilityCollector
+from app.core.data_collectors.tiles.economic import TilesEconomicCollector
+from app.core.data_collectors.tiles.regulatory import TilesRegulatoryCollector
+from app.core.data_collectors.http_client import close_http_client
+
+# Domain packages that are not part of every install
+try:
+    from app.core.data_collectors.banking.demographics import BankingDemographicsCollector
+    from app.core.data_collectors.banking.competition import BankingCompetitionCollector
+except ImportError:
+    BankingDemographicsCollector = None
+    BankingCompetitionCollector = None
+
+try:
+    from app.core.data_collectors.insurance.demographics import InsuranceDemographicsCollector
+except ImportError:
+    InsuranceDemographicsCollector = None
 
 # Domain enumeration
 class Domain(str, Enum):
@@ -22,6 +78,14 @@ class Domain(str, Enum):
     TILES_DISTRIBUTION = "tiles_distribution"
 
 
+# Scoring categories, interned once so every dict keyed by them hits the
+# identity fast path; code below refers to these names, not string literals
+_CATS = tuple(sys.intern(c) for c in (
+    "demographics", "competition", "accessibility", "safety", "economic", "regulatory"
+))
+DEMOGRAPHICS, COMPETITION, ACCESSIBILITY, SAFETY, ECONOMIC, REGULATORY = _CATS
+
+
 # Domain Configuration
 DOMAIN_CONFIG = {
     "childcare": {
@@ -92,68 +156,259 @@ DOMAIN_CONFIG = {
 }
 
 
+def _freeze(mapping: Dict[str, Any]) -> MappingProxyType:
+    """Read-only, recursively frozen view of a config dict with interned keys"""
+    return MappingProxyType({
+        sys.intern(key): _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+# Read-only from here on; the lookup tables below are derived from it at import
+DOMAIN_CONFIG = _freeze(DOMAIN_CONFIG)
+
+
+@dataclass(frozen=True, slots=True)
+class DomainMeta:
+    """Display metadata of one DOMAIN_CONFIG entry; weights live in _W"""
+    name: str
+    tagline: str
+    icon: str
+
+
+# Path/body domains are checked against this set instead of coerced through the enum
+_VALID_DOMAINS = frozenset(d.value for d in Domain)
+
+# Built once at import so rendering uses attribute access, not nested dict lookups
+_DOMAIN_META: Dict[Domain, DomainMeta] = {
+    Domain(key): DomainMeta(name=cfg["name"], tagline=cfg["tagline"], icon=cfg["icon"])
+    for key, cfg in DOMAIN_CONFIG.items()
+}
+
+# Struct-of-arrays view of the numeric config: each domain's category order here,
+# its weights as one row of _W below. DOMAIN_CONFIG stays the source of truth.
+_CATEGORY_ORDER: Dict[Domain, Tuple[str, ...]] = {
+    Domain(key): tuple(sys.intern(category) for category in cfg["categories"])
+    for key, cfg in DOMAIN_CONFIG.items()
+}
+
+# Weights as one (domain x category) matrix: a domain's overall score is a dot
+# product of its score vector with one contiguous row
+_DOMAIN_IDX: Dict[Domain, int] = {d: i for i, d in enumerate(Domain)}
+_CAT_IDX: Dict[str, int] = {category: i for i, category in enumerate(_CATS)}
+_W = np.zeros((len(_DOMAIN_IDX), len(_CAT_IDX)), dtype=np.float64)
+for _key, _cfg in DOMAIN_CONFIG.items():
+    for _category, _cat_cfg in _cfg["categories"].items():
+        _W[_DOMAIN_IDX[Domain(_key)], _CAT_IDX[_category]] = _cat_cfg["weight"]
+del _key, _cfg, _category, _cat_cfg
+_W.flags.writeable = False
+
+# Per-domain weight rows (read-only views into _W) in _CATS order
+DOMAIN_WEIGHT_VECTORS: Dict[str, np.ndarray] = {d.value: _W[_DOMAIN_IDX[d]] for d in Domain}
+
+
+def _instantiate(collector_cls):
+    """Build a collector, or None when its domain package is not installed"""
+    return collector_cls() if collector_cls is not None else None
+
+
+# Collector class per category: per-domain overrides, then the shared default.
+# Banking/insurance entries are None when their packages are not installed.
+_COLLECTOR_CLASSES: Dict[str, Tuple[Dict[Domain, Any], Any]] = {
+    DEMOGRAPHICS: ({
+        Domain.CHILDCARE: DemographicsCollector,
+        Domain.BANKING: BankingDemographicsCollector,
+        Domain.INSURANCE: InsuranceDemographicsCollector,
+        Domain.TILES_DISTRIBUTION: TilesDemographicsCollector,
+        # Add more domains...
+    }, None),
+    COMPETITION: ({
+        Domain.CHILDCARE: CompetitionCollectorEnhanced,
+        Domain.BANKING: BankingCompetitionCollector,
+        Domain.TILES_DISTRIBUTION: TilesCompetitionCollector,
+        # Add more domains...
+    }, None),
+    ACCESSIBILITY: ({Domain.TILES_DISTRIBUTION: TilesAccessibilityCollector}, AccessibilityCollectorEnhanced),
+    ECONOMIC: ({Domain.TILES_DISTRIBUTION: TilesEconomicCollector}, EconomicCollectorEnhanced),
+    REGULATORY: ({Domain.TILES_DISTRIBUTION: TilesRegulatoryCollector}, RegulatoryCollector),
+    # Safety is currently shared across domains but can be specialized
+    SAFETY: ({}, SafetyCollectorEnhanced),
+}
+
+
+# Collector singletons: collectors hold only settings and endpoint URLs, so one
+# instance per (category, domain) is safe to share across concurrent requests
+@lru_cache(maxsize=None)
+def _get_collector(category: str, domain: Domain):
+    overrides, default = _COLLECTOR_CLASSES[category]
+    return _instantiate(overrides.get(domain, default))
+
+
 # Domain-specific data collectors factory
 class CollectorFactory:
     """Factory pattern to create domain-specific collectors"""
     
     @staticmethod
     def get_demographics_collector(domain: Domain):
-        if domain == Domain.CHILDCARE:
-            from app.core.data_collectors.demographics import DemographicsCollector
-            return DemographicsCollector()
-        elif domain == Domain.BANKING:
-            from app.core.data_collectors.banking.demographics import BankingDemographicsCollector
-            return BankingDemographicsCollector()
-        elif domain == Domain.INSURANCE:
-            from app.core.data_collectors.insurance.demographics import InsuranceDemographicsCollector
-            return InsuranceDemographicsCollector()
-        elif domain == Domain.TILES_DISTRIBUTION:
-            from app.core.data_collectors.tiles.demographics import TilesDemographicsCollector
-            return TilesDemographicsCollector()
-        # Add more domains...
+        return _get_collector(DEMOGRAPHICS, domain)
     
     @staticmethod
     def get_competition_collector(domain: Domain):
-        if domain == Domain.CHILDCARE:
-            from app.core.data_collectors.competition_enhanced import CompetitionCollectorEnhanced
-            return CompetitionCollectorEnhanced()
-        elif domain == Domain.BANKING:
-            from app.core.data_collectors.banking.competition import BankingCompetitionCollector
-            return BankingCompetitionCollector()
-        elif domain == Domain.TILES_DISTRIBUTION:
-            from app.core.data_collectors.tiles.competition import TilesCompetitionCollector
-            return TilesCompetitionCollector()
-        # Add more domains...
+        return _get_collector(COMPETITION, domain)
 
     @staticmethod
     def get_accessibility_collector(domain: Domain):
-        if domain == Domain.TILES_DISTRIBUTION:
-            from app.core.data_collectors.tiles.accessibility import TilesAccessibilityCollector
-            return TilesAccessibilityCollector()
-        from app.core.data_collectors.accessibility_enhanced import AccessibilityCollectorEnhanced
-        return AccessibilityCollectorEnhanced()
+        return _get_collector(ACCESSIBILITY, domain)
 
     @staticmethod
     def get_economic_collector(domain: Domain):
-        if domain == Domain.TILES_DISTRIBUTION:
-            from app.core.data_collectors.tiles.economic import TilesEconomicCollector
-            return TilesEconomicCollector()
-        from app.core.data_collectors.economic_enhanced import EconomicCollectorEnhanced
-        return EconomicCollectorEnhanced()
+        return _get_collector(ECONOMIC, domain)
 
     @staticmethod
     def get_regulatory_collector(domain: Domain):
-        if domain == Domain.TILES_DISTRIBUTION:
-            from app.core.data_collectors.tiles.regulatory import TilesRegulatoryCollector
-            return TilesRegulatoryCollector()
-        from app.core.data_collectors.regulatory import RegulatoryCollector
-        return RegulatoryCollector()
+        return _get_collector(REGULATORY, domain)
 
     @staticmethod
     def get_safety_collector(domain: Domain):
-        # Safety is currently shared across domains but can be specialized
-        from app.core.data_collectors.safety_enhanced import SafetyCollectorEnhanced
-        return SafetyCollectorEnhanced()
+        return _get_collector(SAFETY, domain)
+
+
+# Mapping of category keys to factory methods
+_COLLECTOR_MAP: Dict[str, Callable[[Domain], Any]] = {
+    DEMOGRAPHICS: CollectorFactory.get_demographics_collector,
+    COMPETITION: CollectorFactory.get_competition_collector,
+    ACCESSIBILITY: CollectorFactory.get_accessibility_collector,
+    SAFETY: CollectorFactory.get_safety_collector,
+    ECONOMIC: CollectorFactory.get_economic_collector,
+    REGULATORY: CollectorFactory.get_regulatory_collector
+}
+
+
+class SiteColumns:
+    """
+    Structure-of-arrays view over N collector payloads for batch scoring.
+    get(field, default) returns one array holding that field for every site,
+    falling back to the default per site, mirroring dict.get on a single payload.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, field: str, default: Any = 0) -> np.ndarray:
+        return np.array([r.get(field, default) for r in self._records])
+
+
+def _clamp100(value: Any) -> Any:
+    """Upper clamp at 100: builtin min for one payload's scalars, np.minimum
+    only for the SiteColumns arrays that score_batch passes in"""
+    if isinstance(value, np.ndarray):
+        return np.minimum(value, 100.0)
+    return min(100.0, value)
+
+
+def _childcare_demo_kernel(c05: float, income: float, dual: float) -> float:
+    """Weighted, clamped childcare demographics score for one site"""
+    return (
+        min(100.0, c05 / 10.0) * 0.3 +
+        min(100.0, income / 1000.0) * 0.3 +
+        min(100.0, dual) * 0.4
+    )
+
+
+if numba is not None:
+    # Batches are capped at 50 sites, far below where target="parallel" pays
+    # for its thread start-up, so compile a single-threaded ufunc.
+    _childcare_demo_ufunc = numba.vectorize(
+        ["float64(float64, float64, float64)"], target="cpu", cache=True
+    )(_childcare_demo_kernel)
+else:
+    def _childcare_demo_ufunc(c05: np.ndarray, income: np.ndarray, dual: np.ndarray) -> np.ndarray:
+        return (
+            _clamp100(c05 / 10.0) * 0.3 +
+            _clamp100(income / 1000.0) * 0.3 +
+            _clamp100(dual) * 0.4
+        )
+
+
+# Tiles competition score by market saturation; anything else scores 30
+_SATURATION_SCORE: Dict[str, float] = {"LOW": 90.0, "MEDIUM": 60.0}
+
+
+def _saturation_score(saturation: Any) -> Any:
+    """Look up one saturation label, or every label of a SiteColumns column"""
+    if isinstance(saturation, str):
+        return _SATURATION_SCORE.get(saturation, 30.0)
+    return np.fromiter(
+        (_SATURATION_SCORE.get(s, 30.0) for s in saturation),
+        dtype=np.float64,
+        count=len(saturation)
+    )
+
+
+# Domain-specific scoring kernels, keyed by (domain, category).
+# Routing is a single dict lookup; only the leaf expression differs per entry.
+# The same entry scores one payload dict (plain float math) or a SiteColumns
+# batch of N sites (NumPy arrays).
+_SCORE_FN: Dict[Tuple[Domain, str], Callable[[Any], Any]] = {
+    # Childcare
+    (Domain.CHILDCARE, DEMOGRAPHICS): lambda d: _childcare_demo_ufunc(
+        np.asarray(d.get("children_0_5_count", 0), dtype=np.float64),
+        np.asarray(d.get("median_household_income", 0), dtype=np.float64),
+        np.asarray(d.get("dual_income_rate", 0), dtype=np.float64)
+    ) if isinstance(d, SiteColumns) else _childcare_demo_kernel(
+        float(d.get("children_0_5_count", 0)),
+        float(d.get("median_household_income", 0)),
+        float(d.get("dual_income_rate", 0))
+    ),
+
+    # Banking
+    (Domain.BANKING, DEMOGRAPHICS): lambda d: (
+        _clamp100(d.get("high_income_households", 0) / 100) * 0.4 +
+        _clamp100(d.get("employed_population", 0) / 1000) * 0.3 +
+        _clamp100(d.get("small_business_density", 0)) * 0.3
+    ),
+
+    # Insurance
+    (Domain.INSURANCE, DEMOGRAPHICS): lambda d: (
+        _clamp100(d.get("homeownership_rate", 0)) * 0.4 +
+        _clamp100(d.get("vehicle_ownership_rate", 0)) * 0.3 +
+        _clamp100(d.get("family_household_rate", 0)) * 0.3
+    ),
+
+    # Tiles distribution
+    (Domain.TILES_DISTRIBUTION, DEMOGRAPHICS): lambda d: (
+        _clamp100(d.get("median_household_income", 0) / 1200) * 0.4 +
+        d.get("homeownership_rate", 0) * 0.3 +
+        _clamp100(d.get("renovation_potential_rate", 0) * 2) * 0.3
+    ),
+    (Domain.TILES_DISTRIBUTION, COMPETITION): lambda d: _saturation_score(
+        d.get("market_saturation", "LOW")
+    ),
+    (Domain.TILES_DISTRIBUTION, ACCESSIBILITY): lambda d: (
+        d.get("truck_accessibility_score", 60) * 0.4 +
+        d.get("loading_dock_feasibility", 50) * 0.3 +
+        d.get("parking_capacity_index", 50) * 0.3
+    ),
+    (Domain.TILES_DISTRIBUTION, ECONOMIC): lambda d: (
+        (100 - _clamp100(d.get("real_estate_cost_per_sqft", 140) / 3.5)) * 0.4 +
+        d.get("installer_availability_score", 60) * 0.6
+    ),
+    (Domain.TILES_DISTRIBUTION, SAFETY): lambda d: (
+        100 - d.get("crime_rate_index", 30)
+    ),
+    (Domain.TILES_DISTRIBUTION, REGULATORY): lambda d: (
+        d.get("zoning_compliance_score", 60) * 0.6 +
+        d.get("rezoning_feasibility_score", 65) * 0.4
+    ),
+}
+
+
+def _default_score(data: Any) -> float:
+    """Neutral score for (domain, category) pairs without a dedicated kernel"""
+    return 50.0
 
 
 # Domain-specific scoring
@@ -163,102 +418,72 @@ class ScoringEngine:
     @staticmethod
     def calculate_category_score(domain: Domain, category: str, data: Dict[str, Any]) -> float:
         """Calculate score based on domain and category"""
-        
-        if domain == Domain.CHILDCARE:
-            return ScoringEngine._score_childcare(category, data)
-        elif domain == Domain.BANKING:
-            return ScoringEngine._score_banking(category, data)
-        elif domain == Domain.INSURANCE:
-            return ScoringEngine._score_insurance(category, data)
-        elif domain == Domain.TILES_DISTRIBUTION:
-            return ScoringEngine._score_tiles(category, data)
-        
-        return 50.0  # Default fallback
-    
+        return float(_SCORE_FN.get((domain, category), _default_score)(data))
+
     @staticmethod
-    def _score_childcare(category: str, data: Dict[str, Any]) -> float:
-        """Childcare-specific scoring"""
-        if category == "demographics":
-            return (
-                min(100, data.get("children_0_5_count", 0) / 10) * 0.3 +
-                min(100, data.get("median_household_income", 0) / 1000) * 0.3 +
-                min(100, data.get("dual_income_rate", 0)) * 0.4
-            )
-        # ... other categories
-        return 50.0
+    def score_batch(domain: Domain, category: str, arrays: SiteColumns) -> np.ndarray:
+        """Score one category for N sites at once; returns an array of N scores"""
+        kernel = _SCORE_FN.get((domain, category))
+        if kernel is None:
+            return np.full(len(arrays), 50.0)
+        return np.broadcast_to(np.asarray(kernel(arrays), dtype=np.float64), (len(arrays),))
+
+
+def _build_collector_pool() -> Dict[Tuple[Domain, str], Any]:
+    """One long-lived collector per (domain, category); None where not available"""
+    return {
+        (domain, category): factory(domain)
+        for domain in Domain
+        for category, factory in _COLLECTOR_MAP.items()
+    }
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the collector pool and page files before serving any request"""
+    # Collector constructors load settings and the page files hit disk, so both
+    # run in a worker thread rather than blocking the event loop
+    app.state.collectors = await asyncio.to_thread(_build_collector_pool)
+    page_dir = await asyncio.to_thread(_write_page_files)
     
-    @staticmethod
-    def _score_banking(category: str, data: Dict[str, Any]) -> float:
-        """Banking-specific scoring"""
-        if category == "demographics":
-            return (
-                min(100, data.get("high_income_households", 0) / 100) * 0.4 +
-                min(100, data.get("employed_population", 0) / 1000) * 0.3 +
-                min(100, data.get("small_business_density", 0)) * 0.3
-            )
-        # ... other categories
-        return 50.0
+    yield
     
-    @staticmethod
-    def _score_insurance(category: str, data: Dict[str, Any]) -> float:
-        """Insurance-specific scoring"""
-        if category == "demographics":
-            return (
-                min(100, data.get("homeownership_rate", 0)) * 0.4 +
-                min(100, data.get("vehicle_ownership_rate", 0)) * 0.3 +
-                min(100, data.get("family_household_rate", 0)) * 0.3
-            )
-        # ... other categories
-        return 50.0
+    _PAGE_FILES.clear()
+    shutil.rmtree(page_dir, ignore_errors=True)
+    await close_http_client()
 
-    @staticmethod
-    def _score_tiles(category: str, data: Dict[str, Any]) -> float:
-        """Tiles-specific scoring"""
-        if category == "demographics":
-            income_score = min(100, data.get("median_household_income", 0) / 1200)
-            home_score = data.get("homeownership_rate", 0)
-            renov_score = min(100, data.get("renovation_potential_rate", 0) * 2)
-            return (income_score * 0.4 + home_score * 0.3 + renov_score * 0.3)
-        
-        elif category == "competition":
-            saturation = data.get("market_saturation", "LOW")
-            if saturation == "LOW": return 90.0
-            if saturation == "MEDIUM": return 60.0
-            return 30.0
-            
-        elif category == "accessibility":
-            return (
-                data.get("truck_accessibility_score", 60) * 0.4 +
-                data.get("loading_dock_feasibility", 50) * 0.3 +
-                data.get("parking_capacity_index", 50) * 0.3
-            )
-
-        elif category == "economic":
-            return (
-                (100 - min(100, data.get("real_estate_cost_per_sqft", 140) / 3.5)) * 0.4 +
-                data.get("installer_availability_score", 60) * 0.6
-            )
-            
-        elif category == "safety":
-            return (100 - data.get("crime_rate_index", 30))
-
-        elif category == "regulatory":
-            return (
-                data.get("zoning_compliance_score", 60) * 0.6 +
-                data.get("rezoning_feasibility_score", 65) * 0.4
-            )
-            
-        return 50.0
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson; collector payloads may carry NumPy scalars"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 # Multi-domain FastAPI app
-app = FastAPI(title="Universal Location Intelligence Platform")
+app = FastAPI(
+    title="Universal Location Intelligence Platform",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
+# Compress JSON responses; the prebuilt pages already carry Content-Encoding
+# and pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=500)
 
-@app.get("/")
-async def home(request: Request):
-    """Landing page with domain selector"""
-    return HTMLResponse("""
+# Analysis results keyed by (domain, normalized address, radius)
+_ANALYZE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+# One lock per in-flight cache key so identical concurrent requests run once
+_ANALYZE_LOCKS: Dict[Tuple[str, str, float], asyncio.Lock] = {}
+
+
+def _normalize_address(address: str) -> str:
+    """Cache-key form of an address: lowercased with runs of whitespace collapsed"""
+    return " ".join(address.lower().split())
+
+
+# Landing page; static, so it is encoded once at import
+_HOME_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -308,33 +533,32 @@ async def home(request: Request):
         </div>
     </body>
     </html>
-    """)
+    """
 
 
-@app.get("/{domain}/dashboard", response_class=HTMLResponse)
-async def domain_dashboard(request: Request, domain: Domain):
-    """Domain-specific dashboard"""
-    config = DOMAIN_CONFIG.get(domain.value, DOMAIN_CONFIG["childcare"])
+def _render_dashboard(domain: str) -> str:
+    """Dashboard markup for one domain, falling back to the childcare branding"""
+    meta = _DOMAIN_META.get(Domain(domain), _DOMAIN_META[Domain.CHILDCARE])
     
-    return HTMLResponse(f"""
+    return f"""
     <!DOCTYPE html>
     <html>
     <head>
-        <title>{config['name']}</title>
+        <title>{meta.name}</title>
         <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
     </head>
     <body>
         <nav class="navbar navbar-dark bg-primary">
             <div class="container-fluid">
-                <span class="navbar-brand">{config['icon']} {config['name']}</span>
-                <span class="text-white">{config['tagline']}</span>
+                <span class="navbar-brand">{meta.icon} {meta.name}</span>
+                <span class="text-white">{meta.tagline}</span>
             </div>
         </nav>
         
         <div class="container mt-4">
             <div class="card">
                 <div class="card-body">
-                    <h5>Analyze Location for {domain.value.title()}</h5>
+                    <h5>Analyze Location for {domain.title()}</h5>
                     <form id="analysisForm">
                         <input type="text" class="form-control mb-3" 
                                placeholder="Enter address..." id="address">
@@ -354,7 +578,7 @@ async def domain_dashboard(request: Request, domain: Domain):
                     method: 'POST',
                     headers: {{'Content-Type': 'application/json'}},
                     body: JSON.stringify({{
-                        domain: '{domain.value}',
+                        domain: '{domain}',
                         address: address
                     }})
                 }});
@@ -367,82 +591,314 @@ async def domain_dashboard(request: Request, domain: Domain):
         </script>
     </body>
     </html>
-    """)
+    """
 
 
-@app.post("/api/v1/analyze")
-async def analyze_location(request: Request):
-    """Universal analysis endpoint with domain parameter"""
-    body = await request.json()
+# Every page is prebuilt at import; the lifespan writes them to disk for FileResponse
+_PAGES: Dict[str, bytes] = {
+    "home": _HOME_HTML.encode(),
+    **{f"{domain}_dashboard": _render_dashboard(domain).encode() for domain in _VALID_DOMAINS}
+}
+
+# Precompressed variants, in order of preference, so no request pays for compression
+_PAGE_ENCODINGS: Tuple[str, ...] = ("br", "gzip") if brotli is not None else ("gzip",)
+_PAGE_VARIANTS: Dict[Tuple[str, str], bytes] = {}
+for _name, _body in _PAGES.items():
+    _PAGE_VARIANTS[(_name, "identity")] = _body
+    _PAGE_VARIANTS[(_name, "gzip")] = gzip.compress(_body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        _PAGE_VARIANTS[(_name, "br")] = brotli.compress(_body, quality=11)
+del _name, _body
+
+# Content-hash ETags: stable across restarts and workers, unlike FileResponse's mtime-based ones
+_PAGE_ETAGS: Dict[Tuple[str, str], str] = {
+    key: f'"{hashlib.md5(body).hexdigest()}"' for key, body in _PAGE_VARIANTS.items()
+}
+_PAGE_CACHE_CONTROL = "public, max-age=3600"
+
+_PAGE_FILES: Dict[Tuple[str, str], str] = {}
+
+
+def _write_page_files() -> str:
+    """Write the prebuilt pages to tmpfs (when present) and return the directory"""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    page_dir = tempfile.mkdtemp(prefix="location-intel-", dir=base)
+    for (name, encoding), body in _PAGE_VARIANTS.items():
+        path = os.path.join(page_dir, f"{name}.html.{encoding}")
+        with open(path, "wb") as f:
+            f.write(body)
+        _PAGE_FILES[(name, encoding)] = path
+    return page_dir
+
+
+def _accepted_encodings(header: str) -> frozenset:
+    """Codings listed in Accept-Encoding, minus any explicitly refused with q=0"""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return frozenset(accepted)
+
+
+def _page_response(name: str, request: Request) -> Response:
+    """Serve the best precompressed variant of a page, from its file when available"""
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    encoding = next((e for e in _PAGE_ENCODINGS if e in accepted), "identity")
     
-    domain = body.get("domain", "childcare")
-    address = body.get("address", "")
-    radius = body.get("radius_miles", 2.0)
+    etag = _PAGE_ETAGS[(name, encoding)]
+    headers = {
+        "Vary": "Accept-Encoding",
+        "ETag": etag,
+        "Cache-Control": _PAGE_CACHE_CONTROL
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
     
-    if not address:
-        raise HTTPException(status_code=400, detail="Address is required")
+    path = _PAGE_FILES.get((name, encoding))
+    if path is None:
+        # Lifespan has not run (e.g. app mounted without startup events)
+        return HTMLResponse(_PAGE_VARIANTS[(name, encoding)], headers=headers)
+    return FileResponse(path, media_type="text/html", headers=headers)
+
+
+@app.get("/")
+async def home(request: Request):
+    """Landing page with domain selector"""
+    return _page_response("home", request)
+
+
+@app.get("/{domain}/dashboard", response_class=HTMLResponse)
+async def domain_dashboard(request: Request, domain: str):
+    """Domain-specific dashboard"""
+    if domain not in _VALID_DOMAINS:
+        raise HTTPException(status_code=404, detail="Unknown domain")
     
-    # Convert to enum
-    domain_enum = Domain(domain)
+    return _page_response(f"{domain}_dashboard", request)
+
+
+# Upper bound on how long one request waits for any single collector
+_COLLECT_TIMEOUT = 2.0
+
+
+async def _await_category(domain_enum: Domain, category: str, address: str, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wait for one category's payload; a timeout or failure yields an empty payload"""
+    try:
+        async with asyncio.timeout(_COLLECT_TIMEOUT):
+            return await call
+    except TimeoutError:
+        logger.warning(f"{domain_enum.value}/{category} collector timed out after {_COLLECT_TIMEOUT}s for {address!r}")
+    except Exception as e:
+        # One failing collector should not fail the whole analysis
+        logger.warning(f"{domain_enum.value}/{category} collector failed for {address!r}: {e}")
+    return {}
+
+
+async def _collect_categories(
+    collectors: Dict[Tuple[Domain, str], Any],
+    domain_enum: Domain,
+    categories: Tuple[str, ...],
+    address: str,
+    radius: float
+) -> Dict[str, Any]:
+    """Run every configured category collector for one address"""
+    pool = {
+        category: collectors.get((domain_enum, category))
+        for category in categories
+    }
     
-    # Get domain configuration
-    config = DOMAIN_CONFIG[domain]
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            category: tg.create_task(_await_category(
+                domain_enum, category, address, collector.collect(address, radius_miles=radius)
+            ))
+            for category, collector in pool.items()
+            # No collector for this domain in the current install
+            if collector is not None
+        }
     
-    # Collect data for all configured categories
-    results = {}
+    return {category: task.result() for category, task in tasks.items()}
+
+
+class AnalyzeRequest(BaseModel):
+    """Single-address analysis request; validated by pydantic-core before the handler runs"""
+    domain: Domain = Field(Domain.CHILDCARE, description="Industry domain to score for")
+    address: str = Field(..., min_length=1, description="Street address to analyze")
+    radius_miles: float = Field(2.0, gt=0, description="Search radius around the address")
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Multi-address analysis request for one domain"""
+    domain: Domain = Field(Domain.CHILDCARE, description="Industry domain to score for")
+    addresses: List[str] = Field(..., min_length=1, max_length=50, description="Street addresses to analyze (max 50)")
+    radius_miles: float = Field(2.0, gt=0, description="Search radius around each address")
+
+
+class CategoryResult(BaseModel):
+    """Score and raw collector payload for one category"""
+    score: float
+    data: Dict[str, Any]
+
+
+class AnalyzeResponse(BaseModel):
+    """Single-address analysis result"""
+    domain: str
+    address: str
+    overall_score: float
+    categories: Dict[str, CategoryResult]
+    recommendation: str
+
+
+@app.post("/api/v1/analyze", response_model=AnalyzeResponse)
+async def analyze_location(req: AnalyzeRequest, request: Request) -> Response:
+    """Universal analysis endpoint with domain parameter"""
+    domain_enum = req.domain
+    domain = domain_enum.value
+    address = req.address
+    radius = req.radius_miles
     
-    # Mapping of category keys to factory methods
-    collector_map = {
-        "demographics": CollectorFactory.get_demographics_collector,
-        "competition": CollectorFactory.get_competition_collector,
-        "accessibility": CollectorFactory.get_accessibility_collector,
-        "safety": CollectorFactory.get_safety_collector,
-        "economic": CollectorFactory.get_economic_collector,
-        "regulatory": CollectorFactory.get_regulatory_collector
-    }
+    # Serve repeated lookups from cache. Entries are validated against
+    # AnalyzeResponse once when stored, so every response is returned
+    # directly and FastAPI skips re-validating it per request
+    cache_key = (domain, _normalize_address(address), round(radius, 2))
+    cached = _ANALYZE_CACHE.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    lock = _ANALYZE_LOCKS.setdefault(cache_key, asyncio.Lock())
+    try:
+        async with lock:
+            # Another request may have filled the cache while we waited
+            cached = _ANALYZE_CACHE.get(cache_key)
+            if cached is None:
+                analysis = await _analyze(request.app.state.collectors, domain_enum, address, radius)
+                cached = AnalyzeResponse.model_validate(analysis).model_dump()
+                _ANALYZE_CACHE[cache_key] = cached
+    finally:
+        if _ANALYZE_LOCKS.get(cache_key) is lock and not lock.locked():
+            del _ANALYZE_LOCKS[cache_key]
     
-    for category in config["categories"].keys():
-        if category in collector_map:
-            collector = collector_map[category](domain_enum)
-            results[category] = await collector.collect(address, radius_miles=radius)
+    return ORJSONResponse(cached)
+
+
+async def _analyze(
+    collectors: Dict[Tuple[Domain, str], Any],
+    domain_enum: Domain,
+    address: str,
+    radius: float
+) -> Dict[str, Any]:
+    """Collect, score and summarize one address"""
+    # Collect data for all configured categories
+    results = await _collect_categories(collectors, domain_enum, _CATEGORY_ORDER[domain_enum], address, radius)
     
-    # Calculate scores using domain-specific logic
+    # Calculate scores using domain-specific logic, filling the score vector in
+    # the same pass; categories without a collector keep a zero score
     categories = {}
+    scores_vec = np.zeros(len(_CAT_IDX))
     for category, data in results.items():
         score = ScoringEngine.calculate_category_score(domain_enum, category, data)
         categories[category] = {
             "score": score,
             "data": data
         }
+        scores_vec[_CAT_IDX[category]] = score
     
     # Calculate overall score with domain-specific weights
-    overall_score = sum(
-        categories[cat]["score"] * config["categories"][cat]["weight"]
-        for cat in categories.keys()
-    )
+    overall_score = float(scores_vec @ DOMAIN_WEIGHT_VECTORS[domain_enum.value])
     
-    return JSONResponse({
-        "domain": domain,
+    return {
+        "domain": domain_enum.value,
         "address": address,
         "overall_score": round(overall_score, 1),
         "categories": categories,
         "recommendation": get_recommendation(domain_enum, overall_score)
+    }
+
+
+@app.post("/api/v1/cache/invalidate/{domain}")
+async def invalidate_domain_cache(domain: str):
+    """Drop every cached analysis for one domain"""
+    stale = [key for key in list(_ANALYZE_CACHE.keys()) if key[0] == domain]
+    for key in stale:
+        _ANALYZE_CACHE.pop(key, None)
+    
+    return {
+        "domain": domain,
+        "invalidated": len(stale)
+    }
+
+
+@app.post("/api/v1/analyze_batch")
+async def analyze_batch(req: BatchAnalyzeRequest, request: Request):
+    """
+    Batch analysis endpoint - score many candidate addresses for one domain
+    
+    Request body:
+    {
+        "domain": "childcare",
+        "addresses": ["address1", "address2", ...],
+        "radius_miles": 2.0
+    }
+    """
+    domain_enum = req.domain
+    domain = domain_enum.value
+    addresses = req.addresses
+    radius = req.radius_miles
+    
+    categories = _CATEGORY_ORDER[domain_enum]
+    
+    # Collect every site concurrently, then score each category for all sites at once
+    sites = await asyncio.gather(*[
+        _collect_categories(request.app.state.collectors, domain_enum, categories, address, radius)
+        for address in addresses
+    ])
+    
+    # (sites x categories) score matrix times the domain's weight row
+    category_scores = {}
+    score_matrix = np.zeros((len(sites), len(_CAT_IDX)))
+    for category in sites[0].keys():
+        columns = SiteColumns([site[category] for site in sites])
+        category_scores[category] = ScoringEngine.score_batch(domain_enum, category, columns)
+        score_matrix[:, _CAT_IDX[category]] = category_scores[category]
+    
+    overall = score_matrix @ DOMAIN_WEIGHT_VECTORS[domain]
+    
+    return ORJSONResponse({
+        "domain": domain,
+        "total": len(addresses),
+        "results": [
+            {
+                "address": address,
+                "overall_score": round(float(overall[i]), 1),
+                "category_scores": {
+                    cat: round(float(scores[i]), 1)
+                    for cat, scores in category_scores.items()
+                },
+                "recommendation": get_recommendation(domain_enum, float(overall[i]))
+            }
+            for i, address in enumerate(addresses)
+        ]
     })
 
 
+# Recommendation bands: bisect_right(_REC_THRESHOLDS, score) indexes each domain's messages
+_REC_THRESHOLDS = (75.0,)
+_REC_DEFAULT = ("Location assessment complete", "⭐⭐⭐⭐⭐ Excellent location")
+_REC_TABLE: Dict[Domain, Tuple[str, ...]] = {
+    Domain.CHILDCARE: (_REC_DEFAULT[0], "⭐⭐⭐⭐⭐ Excellent location for a childcare center"),
+    Domain.BANKING: (_REC_DEFAULT[0], "⭐⭐⭐⭐⭐ Prime location for a bank branch"),
+    Domain.INSURANCE: (_REC_DEFAULT[0], "⭐⭐⭐⭐⭐ Ideal location for an insurance agency"),
+    Domain.EDUCATION: (_REC_DEFAULT[0], "⭐⭐⭐⭐⭐ Perfect spot for a learning center"),
+    Domain.TILES_DISTRIBUTION: (_REC_DEFAULT[0], "⭐⭐⭐⭐⭐ Prime location for a tiles dealer or distribution center")
+}
+
+
 def get_recommendation(domain: Domain, score: float) -> str:
     """Domain-aware recommendations"""
-    if score >= 75:
-        messages = {
-            Domain.CHILDCARE: "Excellent location for a childcare center",
-            Domain.BANKING: "Prime location for a bank branch",
-            Domain.INSURANCE: "Ideal location for an insurance agency",
-            Domain.EDUCATION: "Perfect spot for a learning center",
-            Domain.TILES_DISTRIBUTION: "Prime location for a tiles dealer or distribution center"
-        }
-        return f"⭐⭐⭐⭐⭐ {messages.get(domain, 'Excellent location')}"
-    # ... other score ranges
-    return "Location assessment complete"
+    return _REC_TABLE.get(domain, _REC_DEFAULT)[bisect_right(_REC_THRESHOLDS, score)]
 
 
 if __name__ == "__main__":
@@ -457,4 +913,14 @@ if __name__ == "__main__":
     print("🧱 Tiles: http://127.0.0.1:9025/tiles_distribution/dashboard")
     print("="*60)
     
-    uvicorn.run(app, host="127.0.0.1", port=9025)
+    # C event loop and HTTP parser, one worker per core, no per-request access log.
+    # Under gunicorn use: gunicorn -k uvicorn.workers.UvicornWorker --preload multi_domain_server:app
+    uvicorn.run(
+        "multi_domain_server:app",
+        host="127.0.0.1",
+        port=9025,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=os.cpu_count() or 1,
+        access_log=False
+    )
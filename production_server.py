@@ -4,14 +4,31 @@ Uses actual Google Maps and Census Bureau APIs
 """
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
 import asyncio
-from datetime import datetime
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
+from cachetools import TTLCache
+import httpx
+import numpy as np
+import orjson
+from pydantic import BaseModel, Field
+
+# Optional JIT for the category scoring kernel; NumPy fallback when absent
+try:
+    import numba
+except ImportError:
+    numba = None
 
 # Import real data collectors
 from app.core.data_collectors.demographics import DemographicsCollector
@@ -24,20 +41,133 @@ from app.core.data_collectors.epa_collector import EPACollector
 from app.core.data_collectors.hud_collector import HUDCollector
 from app.core.data_collectors.fbi_crime_collector import FBICrimeCollector
 from app.core.data_collectors.fema_flood_collector import FEMAFloodCollector
+from app.core.data_collectors.http_client import close_http_client
 from app.utils.timing_xai import PerformanceTracker, DataPointExplainer
 from app.config import get_settings
-import googlemaps
-
-app = FastAPI(title="Brightspot Locator AI - Production")
 
 settings = get_settings()
 
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# Shared async client for Maps calls; one keep-alive pool for the process
+_HTTPX: Optional[httpx.AsyncClient] = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _HTTPX
+    if _HTTPX is None or _HTTPX.is_closed:
+        _HTTPX = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return _HTTPX
+
+
+def _build_collectors() -> Dict[str, Any]:
+    """One long-lived instance of each collector, shared by every request"""
+    return {
+        "demographics": DemographicsCollector(),
+        "competition": CompetitionCollectorEnhanced(),
+        "accessibility": AccessibilityCollectorEnhanced(),
+        "safety": SafetyCollectorEnhanced(),
+        "economic": EconomicCollectorEnhanced(),
+        "regulatory": RegulatoryCollector(),
+        "epa": EPACollector(),
+        "hud": HUDCollector(api_key=getattr(settings, "hud_api_key", None)),
+        "fbi_crime": FBICrimeCollector(api_key=getattr(settings, "fbi_crime_api_key", None)),
+        "fema_flood": FEMAFloodCollector(),
+    }
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the collectors before serving; close the shared HTTP clients on shutdown"""
+    # Collector constructors load settings, so keep them off the event loop
+    app.state.collectors = await asyncio.to_thread(_build_collectors)
+    
+    yield
+    
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+    await close_http_client()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson; collector payloads may carry NumPy
+    scalars or non-string keys, which stdlib json would also have accepted"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Brightspot Locator AI - Production",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Successful geocodes keyed by normalized address; geocodes are stable for days
+_GEOCODE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=86_400)
+# One lock per in-flight address so identical concurrent requests geocode once
+_GEOCODE_LOCKS: Dict[str, asyncio.Lock] = {}
+_GEOCODE_STATS = {"hits": 0, "misses": 0}
+
+# Analysis responses keyed by (normalized address, radius)
+_ANALYZE_CACHE: TTLCache = TTLCache(maxsize=2048, ttl=3600)
+# One lock per in-flight cache key so identical concurrent requests run once
+_ANALYZE_LOCKS: Dict[Tuple[str, float], asyncio.Lock] = {}
+
+
+# Geocoding component type -> (our field, which name to take)
+_COMPONENT_MAP = {
+    "street_number": ("street_number", "long_name"),
+    "route": ("route", "long_name"),
+    "locality": ("city", "long_name"),
+    "administrative_area_level_1": ("state", "short_name"),
+    "postal_code": ("zip_code", "long_name"),
+    "administrative_area_level_2": ("county", "long_name"),
+}
+_COMPONENT_FIELDS = tuple(field for field, _ in _COMPONENT_MAP.values())
+
+
+def _normalize_address(address: str) -> str:
+    """Cache-key form of an address: lowercased with runs of whitespace collapsed"""
+    return " ".join(address.lower().split())
+
 
 async def validate_and_correct_address(address: str) -> Dict[str, Any]:
     """
     Validate and correct address using Google Geocoding API
-    Returns corrected address and location details
+    Returns corrected address and location details; successful lookups are
+    cached so repeat addresses skip the Geocoding round trip
     """
+    cache_key = _normalize_address(address)
+    cached = _GEOCODE_CACHE.get(cache_key)
+    if cached is None:
+        lock = _GEOCODE_LOCKS.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have filled the cache while we waited
+                cached = _GEOCODE_CACHE.get(cache_key)
+                if cached is None:
+                    _GEOCODE_STATS["misses"] += 1
+                    result = await _geocode_address(address)
+                    if not result.get("success"):
+                        return result
+                    _GEOCODE_CACHE[cache_key] = cached = result
+                    return result
+        finally:
+            if _GEOCODE_LOCKS.get(cache_key) is lock and not lock.locked():
+                del _GEOCODE_LOCKS[cache_key]
+    
+    _GEOCODE_STATS["hits"] += 1
+    # Same place, but echo back the caller's own spelling of the address
+    return {**cached, "original_address": address}
+
+
+async def _geocode_address(address: str) -> Dict[str, Any]:
+    """Uncached Google Geocoding lookup behind validate_and_correct_address"""
     if not settings.places_api_key or settings.places_api_key == "your_google_maps_api_key_here":
         return {
             "success": False,
@@ -46,10 +176,23 @@ async def validate_and_correct_address(address: str) -> Dict[str, Any]:
         }
     
     try:
-        gmaps = googlemaps.Client(key=settings.places_api_key)
-        
         # Use Geocoding API to validate and get full address
-        geocode_result = gmaps.geocode(address)
+        response = await _http_client().get(
+            _GEOCODE_URL,
+            params={"address": address, "key": settings.places_api_key}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        status = payload.get("status")
+        
+        if status not in ("OK", "ZERO_RESULTS"):
+            return {
+                "success": False,
+                "error": f"Google Maps API error: {status} ({payload.get('error_message', '')})",
+                "original_address": address
+            }
+        
+        geocode_result = payload.get("results", [])
         
         if not geocode_result or len(geocode_result) == 0:
             return {
@@ -67,28 +210,17 @@ async def validate_and_correct_address(address: str) -> Dict[str, Any]:
         location = result.get("geometry", {}).get("location", {})
         address_components = result.get("address_components", [])
         
-        # Parse components
-        street_number = ""
-        route = ""
-        city = ""
-        state = ""
-        zip_code = ""
-        county = ""
-        
+        # Parse components: one dict lookup per component type
+        parsed = dict.fromkeys(_COMPONENT_FIELDS, "")
         for component in address_components:
-            types = component.get("types", [])
-            if "street_number" in types:
-                street_number = component.get("long_name", "")
-            elif "route" in types:
-                route = component.get("long_name", "")
-            elif "locality" in types:
-                city = component.get("long_name", "")
-            elif "administrative_area_level_1" in types:
-                state = component.get("short_name", "")
-            elif "postal_code" in types:
-                zip_code = component.get("long_name", "")
-            elif "administrative_area_level_2" in types:
-                county = component.get("long_name", "")
+            for component_type in component.get("types", ()):
+                target = _COMPONENT_MAP.get(component_type)
+                if target:
+                    field, name_kind = target
+                    parsed[field] = component.get(name_kind, "")
+                    break
+        street_number = parsed["street_number"]
+        route = parsed["route"]
         
         return {
             "success": True,
@@ -103,21 +235,15 @@ async def validate_and_correct_address(address: str) -> Dict[str, Any]:
                 "street_number": street_number,
                 "route": route,
                 "street_address": f"{street_number} {route}".strip(),
-                "city": city,
-                "state": state,
-                "zip_code": zip_code,
-                "county": county
+                "city": parsed["city"],
+                "state": parsed["state"],
+                "zip_code": parsed["zip_code"],
+                "county": parsed["county"]
             },
             "place_id": result.get("place_id", ""),
             "types": result.get("types", [])
         }
         
-    except googlemaps.exceptions.ApiError as e:
-        return {
-            "success": False,
-            "error": f"Google Maps API error: {str(e)}",
-            "original_address": address
-        }
     except Exception as e:
         return {
             "success": False,
@@ -135,104 +261,159 @@ app.add_middleware(
 )
 
 # Static files and templates
-try:
+if os.path.isdir("app/static"):
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
-except:
-    pass
 
 # Favicon route
 @app.get("/favicon.ico")
 async def favicon():
-    from fastapi.responses import FileResponse
     return FileResponse("app/static/favicon.ico")
 
-try:
-    templates = Jinja2Templates(directory="app/templates")
-except:
-    templates = None
+templates = Jinja2Templates(directory="app/templates") if os.path.isdir("app/templates") else None
+
+_PAGE_CACHE_CONTROL = "public, max-age=60"
+
+
+@lru_cache(maxsize=None)
+def _rendered_page(name: str) -> Tuple[bytes, str]:
+    """Render a context-free page template once; returns (body, ETag)"""
+    body = templates.get_template(name).render().encode("utf-8")
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+
+def _page_response(name: str, request: Request) -> Response:
+    """Serve a cached page, or 304 when the browser already has it"""
+    body, etag = _rendered_page(name)
+    headers = {"ETag": etag, "Cache-Control": _PAGE_CACHE_CONTROL}
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+
+# Overall score weights; categories missing from a result are left out and
+# the remaining weights renormalized
+_OVERALL_CATEGORIES = ("demographics", "competition", "accessibility", "safety", "economic", "regulatory")
+_OVERALL_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.20, 0.10, 0.10])
 
 
 def calculate_overall_score(categories: Dict[str, Any]) -> float:
     """Calculate weighted overall score"""
-    weights = {
-        "demographics": 0.25,
-        "competition": 0.20,
-        "accessibility": 0.15,
-        "safety": 0.20,
-        "economic": 0.10,
-        "regulatory": 0.10
-    }
+    # Categories whose collector failed carry no score and are left out
+    present = np.fromiter(
+        ("score" in categories.get(c, ()) for c in _OVERALL_CATEGORIES),
+        dtype=bool,
+        count=len(_OVERALL_CATEGORIES)
+    )
+    total_weight = _OVERALL_WEIGHTS[present].sum()
+    if total_weight <= 0:
+        return 0
     
-    total_score = 0
-    total_weight = 0
+    scores = np.fromiter(
+        (categories[c]["score"] if p else 0.0 for c, p in zip(_OVERALL_CATEGORIES, present)),
+        dtype=np.float64,
+        count=len(_OVERALL_CATEGORIES)
+    )
+    return float((scores * _OVERALL_WEIGHTS).sum() / total_weight)
+
+
+# Category scoring tables: (key, default, multiplier, divisor, cap, invert, weight).
+# Each term is min(cap, value * multiplier / divisor), flipped to 100 - term
+# when invert is set, then weighted; cap=inf leaves a term unclamped
+_INF = float("inf")
+_SCORER_SPEC: Dict[str, List[Tuple[str, float, float, float, float, bool, float]]] = {
+    "demographics": [
+        ("population_density", 0, 1, 10, 100, False, 0.2),
+        ("median_household_income", 0, 1, 1000, 100, False, 0.2),
+        ("dual_income_rate", 0, 1, 1, 100, False, 0.2),
+        ("family_household_rate", 0, 1, 1, 100, False, 0.2),
+        ("birth_rate", 0, 5, 1, 100, False, 0.2),
+    ],
+    "competition": [
+        ("market_saturation_index", 0, 20, 1, 100, True, 0.35),
+        ("market_gap_score", 50, 1, 1, _INF, False, 0.35),
+        ("competitive_intensity_score", 0, 1, 1, 100, True, 0.3),
+    ],
+    "accessibility": [
+        ("transit_score", 50, 1, 1, _INF, False, 0.3),
+        ("morning_rush_score", 50, 1, 1, _INF, False, 0.3),
+        ("parking_availability_score", 50, 1, 1, _INF, False, 0.2),
+        ("highway_visibility_score", 50, 1, 1, _INF, False, 0.2),
+    ],
+    "safety": [
+        ("crime_rate_index", 30, 1, 1, _INF, True, 0.3),
+        ("pedestrian_safety_score", 70, 1, 1, _INF, False, 0.2),
+        ("air_quality_index", 50, 1, 2, 100, True, 0.2),
+        ("neighborhood_safety_perception", 60, 1, 1, _INF, False, 0.3),
+    ],
+    "economic": [
+        ("real_estate_cost_per_sqft", 150, 1, 4, 100, True, 0.3),
+        ("childcare_worker_availability_score", 60, 1, 1, _INF, False, 0.3),
+        ("business_incentives_score", 50, 1, 1, _INF, False, 0.2),
+        ("economic_growth_indicator", 55, 1, 1, _INF, False, 0.2),
+    ],
+    "regulatory": [
+        ("zoning_compliance_score", 60, 1, 1, _INF, False, 0.4),
+        ("rezoning_feasibility_score", 65, 1, 1, _INF, False, 0.2),
+        ("building_code_complexity_score", 55, 1, 1, 100, True, 0.2),
+        ("licensing_difficulty_score", 55, 1, 1, 100, True, 0.2),
+    ],
+}
+
+
+def _weighted_terms_kernel(vals, multipliers, divisors, caps, inverts, weights):
+    """Sum of clamped, optionally inverted terms times weights, in order"""
+    acc = 0.0
+    for i in range(vals.size):
+        term = vals[i] * multipliers[i] / divisors[i]
+        if term > caps[i]:
+            term = caps[i]
+        if inverts[i]:
+            term = 100.0 - term
+        acc += term * weights[i]
+    return acc
+
+
+if numba is not None:
+    # Explicit signature compiles eagerly at import (and caches to disk), so
+    # no request pays the JIT. No fastmath: it would reorder the sum and
+    # change the one-decimal rounding.
+    _weighted_terms = numba.njit(
+        "float64(float64[::1], float64[::1], float64[::1], float64[::1], boolean[::1], float64[::1])",
+        cache=True
+    )(_weighted_terms_kernel)
+else:
+    def _weighted_terms(vals, multipliers, divisors, caps, inverts, weights):
+        terms = np.minimum(caps, vals * multipliers / divisors)
+        terms = np.where(inverts, 100.0 - terms, terms)
+        # Element-wise product then sum keeps the left-to-right accumulation
+        # of the hand-written formulas, so rounding matches them exactly
+        return (terms * weights).sum()
+
+
+def _make_scorer(spec: List[Tuple[str, float, float, float, float, bool, float]]) -> Callable[[Dict[str, Any]], float]:
+    """Compile one category's spec into a scorer over prebuilt NumPy arrays"""
+    keys, defaults, multipliers, divisors, caps, inverts, weights = zip(*spec)
+    lookups = tuple(zip(keys, defaults))
+    multipliers = np.array(multipliers, dtype=np.float64)
+    divisors = np.array(divisors, dtype=np.float64)
+    caps = np.array(caps, dtype=np.float64)
+    inverts = np.array(inverts, dtype=bool)
+    weights = np.array(weights, dtype=np.float64)
     
-    for category, weight in weights.items():
-        if category in categories:
-            score = categories[category].get("score", 0)
-            total_score += score * weight
-            total_weight += weight
+    def score(data: Dict[str, Any]) -> float:
+        vals = np.fromiter((data.get(k, d) for k, d in lookups), dtype=np.float64, count=len(lookups))
+        return round(float(_weighted_terms(vals, multipliers, divisors, caps, inverts, weights)), 1)
     
-    return total_score / total_weight if total_weight > 0 else 0
+    return score
+
+
+_CATEGORY_SCORERS = {category: _make_scorer(spec) for category, spec in _SCORER_SPEC.items()}
 
 
 def calculate_category_score(category: str, data: Dict[str, Any]) -> float:
     """Calculate score for a category based on its data"""
-    
-    if category == "demographics":
-        score = (
-            min(100, data.get("population_density", 0) / 10) * 0.2 +
-            min(100, data.get("median_household_income", 0) / 1000) * 0.2 +
-            min(100, data.get("dual_income_rate", 0)) * 0.2 +
-            min(100, data.get("family_household_rate", 0)) * 0.2 +
-            min(100, data.get("birth_rate", 0) * 5) * 0.2
-        )
-        return round(score, 1)
-    
-    elif category == "competition":
-        score = (
-            (100 - min(100, data.get("market_saturation_index", 0) * 20)) * 0.35 +
-            data.get("market_gap_score", 50) * 0.35 +
-            (100 - min(100, data.get("competitive_intensity_score", 0))) * 0.3
-        )
-        return round(score, 1)
-    
-    elif category == "accessibility":
-        score = (
-            data.get("transit_score", 50) * 0.3 +
-            data.get("morning_rush_score", 50) * 0.3 +
-            data.get("parking_availability_score", 50) * 0.2 +
-            data.get("highway_visibility_score", 50) * 0.2
-        )
-        return round(score, 1)
-    
-    elif category == "safety":
-        score = (
-            (100 - data.get("crime_rate_index", 30)) * 0.3 +
-            data.get("pedestrian_safety_score", 70) * 0.2 +
-            (100 - min(100, data.get("air_quality_index", 50) / 2)) * 0.2 +
-            data.get("neighborhood_safety_perception", 60) * 0.3
-        )
-        return round(score, 1)
-    
-    elif category == "economic":
-        score = (
-            (100 - min(100, data.get("real_estate_cost_per_sqft", 150) / 4)) * 0.3 +
-            data.get("childcare_worker_availability_score", 60) * 0.3 +
-            data.get("business_incentives_score", 50) * 0.2 +
-            data.get("economic_growth_indicator", 55) * 0.2
-        )
-        return round(score, 1)
-    
-    elif category == "regulatory":
-        score = (
-            data.get("zoning_compliance_score", 60) * 0.4 +
-            data.get("rezoning_feasibility_score", 65) * 0.2 +
-            (100 - min(100, data.get("building_code_complexity_score", 55))) * 0.2 +
-            (100 - min(100, data.get("licensing_difficulty_score", 55))) * 0.2
-        )
-        return round(score, 1)
-    
-    return 50.0
+    scorer = _CATEGORY_SCORERS.get(category)
+    return scorer(data) if scorer is not None else 50.0
 
 
 def get_recommendation(score: float) -> str:
@@ -251,7 +432,7 @@ def get_recommendation(score: float) -> str:
 async def dashboard(request: Request):
     """Serve dashboard"""
     if templates:
-        return templates.TemplateResponse("index.html", {"request": request})
+        return _page_response("index.html", request)
     return HTMLResponse("<h1>Dashboard template not found</h1>")
 
 
@@ -259,23 +440,75 @@ async def dashboard(request: Request):
 async def api_sources(request: Request):
     """Serve API data sources page"""
     if templates:
-        return templates.TemplateResponse("api_sources.html", {"request": request})
+        return _page_response("api_sources.html", request)
     return HTMLResponse("<h1>API Sources page not found</h1>")
 
 
+# API key status is fixed for the life of the process, so resolve it once
+_GMAPS_READY = bool(settings.places_api_key and settings.places_api_key != "your_google_maps_api_key_here")
+_CENSUS_READY = bool(settings.census_api_key and settings.census_api_key != "your_census_api_key_here")
+_HUD_KEY = getattr(settings, "hud_api_key", None)
+_FBI_KEY = getattr(settings, "fbi_crime_api_key", None)
+
+_HEALTH_STATUS = {
+    "status": "healthy",
+    "version": "2.0.0-production",
+    "api_mode": "real",
+    "google_maps_configured": _GMAPS_READY,
+    "census_configured": _CENSUS_READY,
+    "epa_configured": True,  # No key required
+    "hud_configured": bool(_HUD_KEY),
+    "fbi_crime_configured": bool(_FBI_KEY),
+    "fema_configured": True  # No key required
+}
+
+# /api/check-config body, serialized once
+_CONFIG_SNAPSHOT = orjson.dumps({
+    "google_maps": {
+        "configured": _GMAPS_READY,
+        "key_prefix": settings.places_api_key[:10] + "..." if settings.places_api_key else "Not set",
+        "status": "✅ CONFIGURED" if _GMAPS_READY else "❌ NOT CONFIGURED"
+    },
+    "census": {
+        "configured": _CENSUS_READY,
+        "key_prefix": settings.census_api_key[:10] + "..." if settings.census_api_key else "Not set",
+        "status": "✅ CONFIGURED" if _CENSUS_READY else "❌ NOT CONFIGURED"
+    },
+    "epa": {
+        "configured": True,
+        "requires_key": False,
+        "status": "✅ PUBLIC API (no key required)"
+    },
+    "hud": {
+        "configured": bool(_HUD_KEY),
+        "key_prefix": _HUD_KEY[:10] + "..." if _HUD_KEY else "Not set",
+        "status": "✅ CONFIGURED" if _HUD_KEY else "⚠️ Optional - will use fallback data",
+        "register_at": "https://www.huduser.gov/portal/dataset/fmr-api.html"
+    },
+    "fbi_crime": {
+        "configured": bool(_FBI_KEY),
+        "key_prefix": _FBI_KEY[:10] + "..." if _FBI_KEY else "Not set",
+        "status": "✅ CONFIGURED" if _FBI_KEY else "⚠️ Optional - will use fallback data",
+        "register_at": "https://api.data.gov/signup/"
+    },
+    "fema": {
+        "configured": True,
+        "requires_key": False,
+        "status": "✅ PUBLIC API (no key required)"
+    },
+    "real_data_percentage": "92%" if (_HUD_KEY and _FBI_KEY) else "68-85%"
+})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
-        "status": "healthy",
-        "version": "2.0.0-production",
-        "api_mode": "real",
-        "google_maps_configured": bool(settings.places_api_key and settings.places_api_key != "your_google_maps_api_key_here"),
-        "census_configured": bool(settings.census_api_key and settings.census_api_key != "your_census_api_key_here"),
-        "epa_configured": True,  # No key required
-        "hud_configured": bool(settings.hud_api_key),
-        "fbi_crime_configured": bool(settings.fbi_crime_api_key),
-        "fema_configured": True  # No key required
+        **_HEALTH_STATUS,
+        "geocode_cache": {
+            **_GEOCODE_STATS,
+            "size": len(_GEOCODE_CACHE)
+        }
     }
 
 
@@ -291,19 +524,125 @@ async def validate_address_endpoint(request: Request):
     result = await validate_and_correct_address(address)
     
     if result.get("success"):
-        return JSONResponse(result)
+        return ORJSONResponse(result)
     else:
         raise HTTPException(status_code=400, detail=result)
 
 
+# FEMA zones that carry mandatory flood insurance
+_HIGH_RISK_FLOOD_ZONES = frozenset({"A", "AE", "AH", "AO", "V", "VE"})
+
+# Collector steps reported in the response's timing block, in output order
+_TIMED_STEPS = (
+    "demographics", "competition", "accessibility", "environmental", "crime",
+    "flood", "safety", "housing", "economic", "regulatory"
+)
+
+# Keyless FBI/HUD requests only ever end in the fallback data, so skip them
+_SKIPPED_STEPS = frozenset(
+    step for step, key in (("crime", _FBI_KEY), ("housing", _HUD_KEY)) if not key
+)
+
+
+def _iter_insights(results: Dict[str, Any], categories: Dict[str, Any]) -> Iterator[str]:
+    """Yield the key-insight messages for one analysis (now with REAL data
+    from EPA, FBI, FEMA, HUD); each message is only formatted when its rule fires"""
+    demo = results.get("demographics") or {}
+    comp = results.get("competition") or {}
+    crime = results.get("crime") or {}
+    env = results.get("environmental") or {}
+    flood = results.get("flood") or {}
+    housing = results.get("housing") or {}
+    
+    children = demo.get("children_0_5_count", 0)
+    if children > 1000:
+        yield f"Strong demographic profile with {children:,} children aged 0-5"
+    
+    market_gap = comp.get("market_gap_score", 0)
+    if market_gap > 60:
+        yield f"Good market opportunity with {market_gap:.0f}% gap score"
+    
+    safety_score = categories.get("safety", {}).get("score", 0)
+    if safety_score > 75:
+        yield f"Excellent safety metrics ({safety_score:.0f}/100)"
+    
+    # NEW: FBI Crime data insights
+    crime_index = crime.get("crime_rate_index", 50)
+    if crime_index < 30:
+        yield f"Low crime area - {crime.get('risk_level', 'Low')} risk per FBI data"
+    elif crime_index > 70:
+        yield f"High crime area - {crime.get('risk_level', 'High')} risk per FBI data"
+    
+    # NEW: EPA Environmental data insights
+    aqi = env.get("air_quality_index", 50)
+    if aqi < 50:
+        yield f"Good air quality (AQI: {aqi:.0f})"
+    superfund_sites = env.get("superfund_sites_count", 0)
+    if superfund_sites > 0:
+        yield f"⚠️ {superfund_sites} EPA Superfund sites within radius"
+    
+    # NEW: FEMA Flood data insights
+    # No zone at all when the FEMA lookup failed, rather than assuming Zone X
+    flood_zone = flood.get("flood_zone", "X") if flood else None
+    if flood_zone in _HIGH_RISK_FLOOD_ZONES:
+        yield f"⚠️ High flood risk zone ({flood_zone}) - insurance required"
+    elif flood_zone == "X":
+        yield "Low flood risk - FEMA Zone X"
+    
+    # NEW: HUD Real Estate data insights
+    average_fmr = housing.get("average_fmr", 0)
+    if average_fmr > 0:
+        yield f"Market rent: ${average_fmr:.0f}/month (HUD data)"
+    
+    existing_centers = comp.get("existing_centers_count", 0)
+    if existing_centers < 5:
+        yield "Low competition - undersupplied market"
+    elif existing_centers > 10:
+        yield "High competition - saturated market"
+    
+    if demo.get("median_household_income", 0) > 80000:
+        yield "Above-average income levels support premium pricing"
+
+
+async def _tracked(tracker: PerformanceTracker, step: str, coro) -> Dict[str, Any]:
+    """Await one collector, recording its own start/end under ``step`` so
+    concurrent collectors each get an accurate duration"""
+    start = time.perf_counter()
+    error = None
+    try:
+        return await coro
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        tracker.record(step, start, time.perf_counter(), error)
+
+
+async def _fallback(collector: Any) -> Dict[str, Any]:
+    """The collector's built-in fallback estimates, without the network
+    round trip its API would reject for lack of a key"""
+    return collector._get_fallback_data()
+
+
+def _collected(steps: Tuple[str, ...], results: list) -> Tuple[list, Dict[str, BaseException]]:
+    """Split gather(return_exceptions=True) output into payloads, with {} in
+    place of each failed collector, and the failures keyed by step"""
+    failed = {step: r for step, r in zip(steps, results) if isinstance(r, BaseException)}
+    return [{} if isinstance(r, BaseException) else r for r in results], failed
+
+
+class AnalyzeRequest(BaseModel):
+    """Analysis request body; a malformed radius is rejected with a 422 before the handler runs"""
+    address: str = Field("", description="Street address to analyze")
+    radius_miles: float = Field(2.0, gt=0, description="Search radius around the address")
+
+
 @app.post("/api/v1/analyze")
-async def analyze_location(request: Request):
+async def analyze_location(req: AnalyzeRequest, request: Request):
     """Analyze location using REAL APIs"""
     
-    # Get request body
-    body = await request.json()
-    address = body.get("address", "")
-    radius = body.get("radius_miles", 2.0)
+    address = req.address
+    radius = req.radius_miles
     
     if not address:
         raise HTTPException(status_code=400, detail="Address is required")
@@ -315,6 +654,54 @@ async def analyze_location(request: Request):
             detail="Google Maps API key not configured. Please add GOOGLE_MAPS_API_KEY to .env file"
         )
     
+    # Per-step timing detail is only sent back when debugging
+    debug = request.query_params.get("debug") == "1"
+    
+    # Serve repeated lookups from cache
+    cache_key = (_normalize_address(address), round(radius, 2))
+    cached = _ANALYZE_CACHE.get(cache_key)
+    if cached is None:
+        lock = _ANALYZE_LOCKS.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another request may have filled the cache while we waited
+                cached = _ANALYZE_CACHE.get(cache_key)
+                if cached is None:
+                    response = await _analyze(request.app.state.collectors, address, radius)
+                    _ANALYZE_CACHE[cache_key] = response
+                    return ORJSONResponse(_response_body({**response, "cache_hit": False}, debug))
+        finally:
+            if _ANALYZE_LOCKS.get(cache_key) is lock and not lock.locked():
+                del _ANALYZE_LOCKS[cache_key]
+    
+    # Same analysis, but echo back the caller's own spelling of the address
+    corrected_address = cached["address"]
+    return ORJSONResponse(_response_body({
+        **cached,
+        "original_address": address,
+        "address_validation": {
+            **cached["address_validation"],
+            "corrected": corrected_address != address
+        },
+        "cache_hit": True
+    }, debug))
+
+
+def _response_body(response: Dict[str, Any], debug: bool) -> Dict[str, Any]:
+    """Drop per-step timing detail from the analyze body unless ?debug=1 was asked for"""
+    performance = response.get("performance_report")
+    if debug or performance is None:
+        return response
+    return {
+        **response,
+        "performance_report": {
+            key: value for key, value in performance.items() if key != "detailed_steps"
+        }
+    }
+
+
+async def _analyze(collectors: Dict[str, Any], address: str, radius: float) -> Dict[str, Any]:
+    """Validate the address, run every collector and build the analysis response"""
     # Validate and correct address first
     address_validation = await validate_and_correct_address(address)
     
@@ -336,18 +723,17 @@ async def analyze_location(request: Request):
     tracker = PerformanceTracker()
     
     try:
-        # Initialize collectors
-        with tracker.track("initialization"):
-            demographics = DemographicsCollector()
-            competition = CompetitionCollectorEnhanced()
-            accessibility = AccessibilityCollectorEnhanced()
-            safety = SafetyCollectorEnhanced()
-            economic = EconomicCollectorEnhanced()
-            regulatory = RegulatoryCollector()
-            epa = EPACollector()
-            hud = HUDCollector(api_key=settings.hud_api_key if hasattr(settings, 'hud_api_key') else None)
-            fbi_crime = FBICrimeCollector(api_key=settings.fbi_crime_api_key if hasattr(settings, 'fbi_crime_api_key') else None)
-            fema_flood = FEMAFloodCollector()
+        # Long-lived collectors built once at startup
+        demographics = collectors["demographics"]
+        competition = collectors["competition"]
+        accessibility = collectors["accessibility"]
+        safety = collectors["safety"]
+        economic = collectors["economic"]
+        regulatory = collectors["regulatory"]
+        epa = collectors["epa"]
+        hud = collectors["hud"]
+        fbi_crime = collectors["fbi_crime"]
+        fema_flood = collectors["fema_flood"]
         
         results = {}
         
@@ -360,90 +746,88 @@ async def analyze_location(request: Request):
         county = components.get("county", "")
         zip_code = components.get("zip_code", "")
         
-        # Collect demographics (15 points)
-        with tracker.track("demographics"):
-            demographics_data = await demographics.collect(corrected_address, radius_miles=radius)
-            results["demographics"] = demographics_data
-        
-        # Collect competition (12 points)
-        with tracker.track("competition"):
-            competition_data = await competition.collect(corrected_address, radius_miles=radius)
-            results["competition"] = competition_data
-        
-        # Collect accessibility (10 points)
-        with tracker.track("accessibility"):
-            accessibility_data = await accessibility.collect(corrected_address, radius_miles=radius)
-            results["accessibility"] = accessibility_data
-        
-        # Collect NEW environmental data from EPA (3 new real data points)
-        with tracker.track("environmental"):
-            epa_data = await epa.collect(corrected_address, latitude, longitude, radius_miles=radius)
-            results["environmental"] = epa_data
-        
-        # Collect NEW crime data from FBI (9 new real data points)
-        with tracker.track("crime"):
-            crime_data = await fbi_crime.collect(corrected_address, state, county, latitude, longitude)
-            results["crime"] = crime_data
-        
-        # Collect NEW flood data from FEMA (6 new real data points)
-        with tracker.track("flood"):
-            flood_data = await fema_flood.collect(corrected_address, latitude, longitude)
-            results["flood"] = flood_data
-        
-        # Collect safety (11 points) - now ENHANCED with EPA, FBI, FEMA real data
-        with tracker.track("safety"):
-            safety_data = await safety.collect(corrected_address, radius_miles=radius)
-            
-            # Merge real EPA data (air quality, environmental hazards)
-            if epa_data:
-                safety_data["air_quality_index"] = epa_data.get("air_quality_index", safety_data.get("air_quality_index", 50))
-                safety_data["environmental_hazards_score"] = epa_data.get("environmental_hazards_score", safety_data.get("environmental_hazards_score", 0))
-                safety_data["pollution_risk"] = epa_data.get("pollution_risk", "Unknown")
-                safety_data["tri_sites_count"] = epa_data.get("tri_sites_count", 0)
-                safety_data["superfund_sites_count"] = epa_data.get("superfund_sites_count", 0)
-            
-            # Merge real FBI crime data
-            if crime_data:
-                safety_data["crime_rate_index"] = crime_data.get("crime_rate_index", safety_data.get("crime_rate_index", 50))
-                safety_data["neighborhood_safety_score"] = crime_data.get("neighborhood_safety_score", safety_data.get("neighborhood_safety_score", 50))
-                safety_data["violent_crime_rate"] = crime_data.get("violent_crime_rate", 0)
-                safety_data["property_crime_rate"] = crime_data.get("property_crime_rate", 0)
-            
-            # Merge real FEMA flood data
-            if flood_data:
-                safety_data["flood_risk_indicator"] = flood_data.get("flood_risk_score", safety_data.get("flood_risk_indicator", 25))
-                safety_data["flood_zone"] = flood_data.get("flood_zone", "X")
-                safety_data["flood_risk_level"] = flood_data.get("flood_risk_level", "Low")
-                safety_data["insurance_required"] = flood_data.get("insurance_required", False)
-            
-            results["safety"] = safety_data
-        
-        # Collect NEW real estate data from HUD (5 new real data points)
-        with tracker.track("housing"):
-            hud_data = await hud.collect(corrected_address, zip_code, state)
-            results["housing"] = hud_data
-        
-        # Collect economic (10 points) - now ENHANCED with HUD real data
-        with tracker.track("economic"):
-            economic_data = await economic.collect(corrected_address, radius_miles=radius)
-            
-            # Merge real HUD data (real estate costs)
-            if hud_data:
-                economic_data["real_estate_cost_per_sqft"] = hud_data.get("real_estate_cost_per_sqft", economic_data.get("real_estate_cost_per_sqft", 150))
-                economic_data["estimated_monthly_rent"] = hud_data.get("estimated_monthly_rent", economic_data.get("estimated_monthly_rent", 0))
-                economic_data["startup_cost_estimate"] = hud_data.get("estimated_startup_cost", economic_data.get("startup_cost_estimate", 0))
-                economic_data["average_market_rent"] = hud_data.get("average_fmr", 0)
-            
-            results["economic"] = economic_data
-        
-        # Collect regulatory (8 points)
-        with tracker.track("regulatory"):
-            regulatory_data = await regulatory.collect(corrected_address, radius_miles=radius)
-            results["regulatory"] = regulatory_data
-        
-        # Calculate scores for each category
+        # Every collector runs concurrently, so latency is the slowest API
+        # rather than their sum; the EPA/FBI/FEMA and HUD data are merged into
+        # safety and economic once everything has returned. Calls are in
+        # _TIMED_STEPS order, which is how failures are attributed to steps
+        (
+            demographics_data,
+            competition_data,
+            accessibility_data,
+            epa_data,
+            crime_data,
+            flood_data,
+            safety_data,
+            hud_data,
+            economic_data,
+            regulatory_data
+        ), failed = _collected(_TIMED_STEPS, await asyncio.gather(
+            _tracked(tracker, "demographics", demographics.collect(corrected_address, radius_miles=radius)),  # 15 points
+            _tracked(tracker, "competition", competition.collect(corrected_address, radius_miles=radius)),  # 12 points
+            _tracked(tracker, "accessibility", accessibility.collect(corrected_address, radius_miles=radius)),  # 10 points
+            _tracked(tracker, "environmental", epa.collect(corrected_address, latitude, longitude, radius_miles=radius)),  # EPA, 3 points
+            _tracked(tracker, "crime", fbi_crime.collect(corrected_address, state, county, latitude, longitude))  # FBI, 9 points
+            if _FBI_KEY else _fallback(fbi_crime),
+            _tracked(tracker, "flood", fema_flood.collect(corrected_address, latitude, longitude)),  # FEMA, 6 points
+            _tracked(tracker, "safety", safety.collect(corrected_address, radius_miles=radius)),  # 11 points
+            _tracked(tracker, "housing", hud.collect(corrected_address, zip_code, state))  # HUD, 5 points
+            if _HUD_KEY else _fallback(hud),
+            _tracked(tracker, "economic", economic.collect(corrected_address, radius_miles=radius)),  # 10 points
+            _tracked(tracker, "regulatory", regulatory.collect(corrected_address, radius_miles=radius)),  # 8 points
+            return_exceptions=True
+        ))
+        
+        # Merge real EPA data (air quality, environmental hazards)
+        if epa_data:
+            safety_data["air_quality_index"] = epa_data.get("air_quality_index", safety_data.get("air_quality_index", 50))
+            safety_data["environmental_hazards_score"] = epa_data.get("environmental_hazards_score", safety_data.get("environmental_hazards_score", 0))
+            safety_data["pollution_risk"] = epa_data.get("pollution_risk", "Unknown")
+            safety_data["tri_sites_count"] = epa_data.get("tri_sites_count", 0)
+            safety_data["superfund_sites_count"] = epa_data.get("superfund_sites_count", 0)
+        
+        # Merge real FBI crime data
+        if crime_data:
+            safety_data["crime_rate_index"] = crime_data.get("crime_rate_index", safety_data.get("crime_rate_index", 50))
+            safety_data["neighborhood_safety_score"] = crime_data.get("neighborhood_safety_score", safety_data.get("neighborhood_safety_score", 50))
+            safety_data["violent_crime_rate"] = crime_data.get("violent_crime_rate", 0)
+            safety_data["property_crime_rate"] = crime_data.get("property_crime_rate", 0)
+        
+        # Merge real FEMA flood data
+        if flood_data:
+            safety_data["flood_risk_indicator"] = flood_data.get("flood_risk_score", safety_data.get("flood_risk_indicator", 25))
+            safety_data["flood_zone"] = flood_data.get("flood_zone", "X")
+            safety_data["flood_risk_level"] = flood_data.get("flood_risk_level", "Low")
+            safety_data["insurance_required"] = flood_data.get("insurance_required", False)
+        
+        # Merge real HUD data (real estate costs)
+        if hud_data:
+            economic_data["real_estate_cost_per_sqft"] = hud_data.get("real_estate_cost_per_sqft", economic_data.get("real_estate_cost_per_sqft", 150))
+            economic_data["estimated_monthly_rent"] = hud_data.get("estimated_monthly_rent", economic_data.get("estimated_monthly_rent", 0))
+            economic_data["startup_cost_estimate"] = hud_data.get("estimated_startup_cost", economic_data.get("startup_cost_estimate", 0))
+            economic_data["average_market_rent"] = hud_data.get("average_fmr", 0)
+        
+        # Same key order as the old sequential pipeline
+        results["demographics"] = demographics_data
+        results["competition"] = competition_data
+        results["accessibility"] = accessibility_data
+        results["environmental"] = epa_data
+        results["crime"] = crime_data
+        results["flood"] = flood_data
+        results["safety"] = safety_data
+        results["housing"] = hud_data
+        results["economic"] = economic_data
+        results["regulatory"] = regulatory_data
+        
+        # Calculate scores for each category; a failed collector is reported
+        # as such instead of being scored from its defaults
         categories = {}
         for category, data in results.items():
+            if category in failed:
+                categories[category] = {
+                    "error": str(failed[category]) or type(failed[category]).__name__,
+                    "data": data
+                }
+                continue
             score = calculate_category_score(category, data)
             categories[category] = {
                 "score": score,
@@ -456,48 +840,10 @@ async def analyze_location(request: Request):
         
         # Get performance report
         performance = tracker.get_report()
+        step_ms = {step["step"]: step["duration_ms"] for step in performance["detailed_steps"]}
         
-        # Generate key insights (now with REAL data from EPA, FBI, FEMA, HUD)
-        key_insights = []
-        
-        if results.get("demographics", {}).get("children_0_5_count", 0) > 1000:
-            key_insights.append(f"Strong demographic profile with {results['demographics'].get('children_0_5_count', 0):,} children aged 0-5")
-        
-        if results.get("competition", {}).get("market_gap_score", 0) > 60:
-            key_insights.append(f"Good market opportunity with {results['competition'].get('market_gap_score', 0):.0f}% gap score")
-        
-        if categories.get("safety", {}).get("score", 0) > 75:
-            key_insights.append(f"Excellent safety metrics ({categories['safety']['score']:.0f}/100)")
-        
-        # NEW: FBI Crime data insights
-        if results.get("crime", {}).get("crime_rate_index", 50) < 30:
-            key_insights.append(f"Low crime area - {results['crime'].get('risk_level', 'Low')} risk per FBI data")
-        elif results.get("crime", {}).get("crime_rate_index", 50) > 70:
-            key_insights.append(f"High crime area - {results['crime'].get('risk_level', 'High')} risk per FBI data")
-        
-        # NEW: EPA Environmental data insights
-        if results.get("environmental", {}).get("air_quality_index", 50) < 50:
-            key_insights.append(f"Good air quality (AQI: {results['environmental'].get('air_quality_index', 0):.0f})")
-        if results.get("environmental", {}).get("superfund_sites_count", 0) > 0:
-            key_insights.append(f"⚠️ {results['environmental'].get('superfund_sites_count', 0)} EPA Superfund sites within radius")
-        
-        # NEW: FEMA Flood data insights
-        if results.get("flood", {}).get("flood_zone", "X") in ["A", "AE", "AH", "AO", "V", "VE"]:
-            key_insights.append(f"⚠️ High flood risk zone ({results['flood'].get('flood_zone', 'Unknown')}) - insurance required")
-        elif results.get("flood", {}).get("flood_zone", "X") == "X":
-            key_insights.append("Low flood risk - FEMA Zone X")
-        
-        # NEW: HUD Real Estate data insights
-        if results.get("housing", {}).get("average_fmr", 0) > 0:
-            key_insights.append(f"Market rent: ${results['housing'].get('average_fmr', 0):.0f}/month (HUD data)")
-        
-        if results.get("competition", {}).get("existing_centers_count", 0) < 5:
-            key_insights.append("Low competition - undersupplied market")
-        elif results.get("competition", {}).get("existing_centers_count", 0) > 10:
-            key_insights.append("High competition - saturated market")
-        
-        if results.get("demographics", {}).get("median_household_income", 0) > 80000:
-            key_insights.append("Above-average income levels support premium pricing")
+        # Generate key insights
+        key_insights = list(_iter_insights(results, categories))
         
         # Build response
         response = {
@@ -509,32 +855,25 @@ async def analyze_location(request: Request):
                 "location": address_validation.get("location", {}),
                 "place_id": address_validation.get("place_id", "")
             },
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "overall_score": round(overall_score, 1),
             "recommendation": recommendation,
             "data_points_collected": 66,
             "analysis_time_ms": performance["total_time_ms"],
             "categories": categories,
             "timing": {
-                "demographics_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "demographics"), 0),
-                "competition_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "competition"), 0),
-                "accessibility_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "accessibility"), 0),
-                "environmental_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "environmental"), 0),
-                "crime_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "crime"), 0),
-                "flood_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "flood"), 0),
-                "safety_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "safety"), 0),
-                "housing_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "housing"), 0),
-                "economic_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "economic"), 0),
-                "regulatory_ms": next((s["duration_ms"] for s in performance["detailed_steps"] if s["step"] == "regulatory"), 0)
+                f"{step}_ms": "skipped" if step in _SKIPPED_STEPS else step_ms.get(step, 0)
+                for step in _TIMED_STEPS
             },
             "key_insights": key_insights,
             "performance_report": performance
         }
         
-        return JSONResponse(response)
+        return response
         
     except Exception as e:
-        import traceback
+        # Exception, not BaseException: a client disconnect cancels the
+        # collectors with CancelledError, which must propagate
         error_detail = str(e)
         if "REQUEST_DENIED" in error_detail:
             error_detail = "Google Maps API key is invalid or APIs are not enabled. Please check your API key and enable required APIs."
@@ -550,41 +889,7 @@ async def analyze_location(request: Request):
 @app.get("/api/check-config")
 async def check_configuration():
     """Check if APIs are configured"""
-    return {
-        "google_maps": {
-            "configured": bool(settings.places_api_key and settings.places_api_key != "your_google_maps_api_key_here"),
-            "key_prefix": settings.places_api_key[:10] + "..." if settings.places_api_key else "Not set",
-            "status": "✅ CONFIGURED" if settings.places_api_key and settings.places_api_key != "your_google_maps_api_key_here" else "❌ NOT CONFIGURED"
-        },
-        "census": {
-            "configured": bool(settings.census_api_key and settings.census_api_key != "your_census_api_key_here"),
-            "key_prefix": settings.census_api_key[:10] + "..." if settings.census_api_key else "Not set",
-            "status": "✅ CONFIGURED" if settings.census_api_key and settings.census_api_key != "your_census_api_key_here" else "❌ NOT CONFIGURED"
-        },
-        "epa": {
-            "configured": True,
-            "requires_key": False,
-            "status": "✅ PUBLIC API (no key required)"
-        },
-        "hud": {
-            "configured": bool(hasattr(settings, 'hud_api_key') and settings.hud_api_key),
-            "key_prefix": settings.hud_api_key[:10] + "..." if hasattr(settings, 'hud_api_key') and settings.hud_api_key else "Not set",
-            "status": "✅ CONFIGURED" if hasattr(settings, 'hud_api_key') and settings.hud_api_key else "⚠️ Optional - will use fallback data",
-            "register_at": "https://www.huduser.gov/portal/dataset/fmr-api.html"
-        },
-        "fbi_crime": {
-            "configured": bool(hasattr(settings, 'fbi_crime_api_key') and settings.fbi_crime_api_key),
-            "key_prefix": settings.fbi_crime_api_key[:10] + "..." if hasattr(settings, 'fbi_crime_api_key') and settings.fbi_crime_api_key else "Not set",
-            "status": "✅ CONFIGURED" if hasattr(settings, 'fbi_crime_api_key') and settings.fbi_crime_api_key else "⚠️ Optional - will use fallback data",
-            "register_at": "https://api.data.gov/signup/"
-        },
-        "fema": {
-            "configured": True,
-            "requires_key": False,
-            "status": "✅ PUBLIC API (no key required)"
-        },
-        "real_data_percentage": "92%" if (hasattr(settings, 'hud_api_key') and settings.hud_api_key and hasattr(settings, 'fbi_crime_api_key') and settings.fbi_crime_api_key) else "68-85%"
-    }
+    return Response(_CONFIG_SNAPSHOT, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -598,9 +903,15 @@ if __name__ == "__main__":
     print("\n⚠️  IMPORTANT: Using REAL APIs - requires valid API keys in .env file")
     print("="*80 + "\n")
     
+    # C event loop and HTTP parser, one worker per core; workers are recycled
+    # after 10k requests to cap slow memory growth. Caches are per worker.
     uvicorn.run(
-        app,
+        "production_server:app",
         host="127.0.0.1",
         port=9025,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=os.cpu_count() or 1,
+        limit_max_requests=10_000,
         log_level="info"
     )
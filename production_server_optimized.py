@@ -23,13 +23,22 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, Field
 import uvicorn
+from contextlib import asynccontextmanager
 from typing import Dict, Any, List, Optional
 import asyncio
 from datetime import datetime
 import time
 import json
+import hashlib
+import logging
 import os
+import sys
+import orjson
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 # OpenAI Integration
 try:
@@ -50,9 +59,10 @@ from app.core.data_collectors.epa_collector import EPACollector
 from app.core.data_collectors.hud_collector import HUDCollector
 from app.core.data_collectors.fbi_crime_collector import FBICrimeCollector
 from app.core.data_collectors.fema_flood_collector import FEMAFloodCollector
+from app.core.data_collectors.http_client import close_http_client
 from app.utils.timing_xai import PerformanceTracker, DataPointExplainer
 from app.config import get_settings
-import googlemaps
+import httpx
 
 # Import new features
 from redis_cache import get_redis_cache
@@ -77,79 +87,197 @@ else:
         print("⚠️ OPENAI_API_KEY not set. AI explanations will use rule-based system.")
 
 
-async def generate_ai_explanation_openai(category: str, data: Dict[str, Any], score: float) -> Dict[str, str]:
-    """Generate AI-powered explanation using OpenAI/ChatGPT API"""
-    if not openai_client:
-        # Fallback to rule-based explanation
+# Category fields never sent to OpenAI, and the most serialized metric JSON
+# sent per category
+_PROMPT_EXCLUDED_FIELDS = frozenset({"success", "address", "coordinates", "data_source", "data_source_details"})
+PROMPT_METRICS_BUDGET = 1500
+
+
+def _prompt_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Scalar metrics of a category for the prompt, in order, stopping once
+    their JSON would pass PROMPT_METRICS_BUDGET characters"""
+    metrics = {}
+    size = 2  # {}
+    for k, v in data.items():
+        if not isinstance(v, _SCALAR_TYPES) or k in _PROMPT_EXCLUDED_FIELDS or k.endswith('_explanation'):
+            continue
+        size += len(k) + len(orjson.dumps(v)) + 4  # "key":value,
+        if size > PROMPT_METRICS_BUDGET:
+            break
+        metrics[k] = v
+    return metrics
+
+
+async def generate_ai_explanations_batch(categories_payload: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """Generate AI-powered explanations for every category in one OpenAI/ChatGPT request
+    
+    ``categories_payload`` maps each category to ``{"score": ..., "data": ...}``;
+    the result maps each category to its explanation.
+    """
+    def fallback(category: str, score: float, error: str) -> Dict[str, str]:
         return {
-            "interpretation": f"Score of {score:.1f}/100 indicates {'excellent' if score >= 75 else 'good' if score >= 60 else 'fair' if score >= 45 else 'needs attention'} potential for {category}.",
-            "recommendation": "Review detailed metrics for specific insights.",
-            "ai_source": "rule-based"
+            "interpretation": f"Score of {score:.1f}/100 suggests {'favorable' if score >= 60 else 'moderate'} conditions for {category}.",
+            "recommendation": "Analyze individual metrics for detailed insights.",
+            "ai_source": "fallback",
+            "error": error
         }
     
+    payload = {
+        category: {"score": round(entry["score"], 1), "metrics": _prompt_metrics(entry["data"])}
+        for category, entry in categories_payload.items()
+    }
+    
+    # Locations with the same metrics and (rounded) score get the same
+    # explanation, so reuse earlier answers and only ask OpenAI for the rest
+    cache_keys = {
+        category: "aiexp:" + hashlib.sha1(orjson.dumps(
+            {"c": category, "s": round(entry["score"]), "d": entry["metrics"]},
+            option=orjson.OPT_SORT_KEYS
+        )).hexdigest()
+        for category, entry in payload.items()
+    }
+    cached = redis_cache.get_raw_many(list(cache_keys.values()))
+    explanations = {
+        category: explanation
+        for category, explanation in zip(cache_keys, cached)
+        if explanation is not None
+    }
+    payload = {category: entry for category, entry in payload.items() if category not in explanations}
+    if not payload:
+        return explanations
+    
     try:
-        # Filter to only scalar values for the prompt
-        filtered_data = {k: v for k, v in data.items() 
-                        if isinstance(v, (int, float, str, bool)) 
-                        and not k.endswith('_explanation')
-                        and k not in ['success', 'address', 'coordinates', 'data_source', 'data_source_details']}
-        
         # Create prompt for ChatGPT
-        prompt = f"""You are an expert childcare business location analyst. Analyze this {category} data for a potential childcare center location.
+        prompt = f"""You are an expert childcare business location analyst. Analyze this data for a potential childcare center location.
+Each category has an overall score (0-100) and its key metrics:
+{orjson.dumps(payload).decode()}
 
-Category: {category.upper()}
-Overall Score: {score:.1f}/100
-Key Metrics:
-{json.dumps(filtered_data, indent=2)[:1500]}
-
-Provide a brief, actionable analysis in JSON format with these fields:
+Return a JSON object with one key per category ({', '.join(payload)}). Each value is an object with these fields:
 1. "interpretation": 2-3 sentences explaining what this score means for opening a childcare business here. Be specific about the data.
 2. "recommendation": 1-2 specific, actionable recommendations based on the data.
-3. "key_insight": One key takeaway for a business owner.
-
-Return ONLY valid JSON, no markdown or extra text."""
+3. "key_insight": One key takeaway for a business owner."""
 
-        response = openai_client.chat.completions.create(
+        # The OpenAI client is synchronous; run it off the event loop
+        response = await asyncio.to_thread(
+            openai_client.chat.completions.create,
             model="gpt-4o-mini",  # Cost-effective and fast
             messages=[
                 {"role": "system", "content": "You are a childcare business location expert. Provide concise, actionable insights. Always respond with valid JSON only."},
                 {"role": "user", "content": prompt}
             ],
-            max_tokens=400,
+            response_format={"type": "json_object"},
+            max_tokens=400 * len(payload),
             temperature=0.7
         )
         
-        result_text = response.choices[0].message.content.strip()
+        result = json.loads(response.choices[0].message.content)
+    except Exception as e:
+        logger.warning("OpenAI API error for category explanations: %s", e)
+        result = {}
+        error = str(e)
+    else:
+        error = "Missing from OpenAI response"
+    
+    fresh = {}
+    for category, entry in payload.items():
+        explanation = result.get(category)
+        if isinstance(explanation, dict):
+            explanations[category] = {**explanation, "ai_source": "openai"}
+            fresh[cache_keys[category]] = explanations[category]
+        else:
+            explanations[category] = fallback(category, entry["score"], error)
+    redis_cache.set_raw_many(fresh, ttl_hours=24 * 7)
+    return explanations
+
+
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+
+# Shared async client for Maps calls; one keep-alive pool for the process
+_HTTPX: Optional[httpx.AsyncClient] = None
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use"""
+    global _HTTPX
+    if _HTTPX is None or _HTTPX.is_closed:
+        _HTTPX = httpx.AsyncClient(
+            timeout=5.0,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        )
+    return _HTTPX
+
+
+# Analyses waiting to be written to the database; the writer commits them in
+# batches so many requests share one SQLite transaction (and fsync)
+SAVE_BATCH_SIZE = 50
+SAVE_BATCH_WINDOW_SECONDS = 0.2
+
+
+async def _save_worker(queue: "asyncio.Queue[Optional[Dict[str, Any]]]"):
+    """Drain the save queue, writing up to SAVE_BATCH_SIZE analyses (or
+    whatever arrived within SAVE_BATCH_WINDOW_SECONDS) per transaction.
+    A ``None`` item flushes the current batch and stops the worker."""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
         
-        # Try to parse JSON
-        try:
-            # Remove markdown code blocks if present
-            if result_text.startswith("```"):
-                result_text = result_text.split("```")[1]
-                if result_text.startswith("json"):
-                    result_text = result_text[4:]
-            result = json.loads(result_text)
-            result["ai_source"] = "openai"
-            return result
-        except json.JSONDecodeError:
-            # If JSON parsing fails, use the raw text
-            return {
-                "interpretation": result_text[:300],
-                "recommendation": "Review metrics for detailed analysis.",
-                "ai_source": "openai-text"
-            }
-            
+        batch = [item]
+        deadline = loop.time() + SAVE_BATCH_WINDOW_SECONDS
+        while len(batch) < SAVE_BATCH_SIZE:
+            try:
+                item = await asyncio.wait_for(queue.get(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                await _write_batch(batch)
+                return
+            batch.append(item)
+        
+        await _write_batch(batch)
+
+
+async def _write_batch(batch: List[Dict[str, Any]]):
+    """Save one batch of analyses in a worker thread"""
+    try:
+        await asyncio.to_thread(database.save_analyses, batch)
     except Exception as e:
-        print(f"OpenAI API error for {category}: {e}")
-        return {
-            "interpretation": f"Score of {score:.1f}/100 suggests {'favorable' if score >= 60 else 'moderate'} conditions for {category}.",
-            "recommendation": "Analyze individual metrics for detailed insights.",
-            "ai_source": "fallback",
-            "error": str(e)
-        }
+        logger.error("Database save failed for %d analyses: %s", len(batch), e)
 
 
-app = FastAPI(title="Brightspot Locator AI - Enterprise v3.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the database writer; on shutdown let it flush what is still queued
+    and close the shared HTTP client"""
+    # Created here rather than at import so the queue belongs to the serving loop
+    queue = app.state.save_queue = asyncio.Queue()
+    worker = asyncio.create_task(_save_worker(queue))
+    
+    yield
+    
+    # Later saves fall back to direct writes while the worker drains
+    app.state.save_queue = None
+    queue.put_nowait(None)
+    await worker
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+    await close_http_client()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered by orjson; collector payloads may carry NumPy
+    scalars or non-string keys, which stdlib json would also have accepted"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Brightspot Locator AI - Enterprise v3.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 settings = get_settings()
 
 # Initialize features
@@ -190,8 +318,22 @@ async def validate_and_correct_address(address: str) -> Dict[str, Any]:
         }
     
     try:
-        gmaps = googlemaps.Client(key=settings.places_api_key)
-        geocode_result = gmaps.geocode(address)
+        response = await _http_client().get(
+            _GEOCODE_URL,
+            params={"address": address, "key": settings.places_api_key}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        status = payload.get("status")
+        
+        if status not in ("OK", "ZERO_RESULTS"):
+            return {
+                "success": False,
+                "error": f"Google Maps API error: {status} ({payload.get('error_message', '')})",
+                "original_address": address
+            }
+        
+        geocode_result = payload.get("results", [])
         
         if not geocode_result or len(geocode_result) == 0:
             return {
@@ -258,87 +400,165 @@ async def validate_and_correct_address(address: str) -> Dict[str, Any]:
         }
 
 
+# Category fields that are metadata rather than data metrics; excluded from
+# metrics_count and from data point explanations
+METADATA_FIELDS = frozenset({
+    "success", "address", "coordinates", "data_source", "note", "score", 
+    "radius_miles", "collection_time_ms", "metrics_count", "explanation",
+    "error", "metrics", "search_radius_miles", "centers_analyzed",
+    "total_population", "land_area_sqmi", "jurisdiction", "state",
+    "centers_details", "data_source_details"
+})
+
+# Value types that count as a data metric (not dicts, lists, etc.)
+_SCALAR_TYPES = (int, float, str, bool)
+
+
+def _is_metric_key(key: str) -> bool:
+    """Whether a category key holds a data metric rather than metadata or
+    a generated ``*_explanation``"""
+    return key not in METADATA_FIELDS and not key.endswith("_explanation")
+
+
+# Category scoring tables: (key, default, multiplier, divisor, cap, invert, weight).
+# Each term is min(cap, value * multiplier / divisor), flipped to 100 - term
+# when invert is set, then weighted; cap=inf leaves a term unclamped
+_INF = float("inf")
+_SCORE_SPEC = {
+    "demographics": [
+        ("population_density", 0, 1, 10, 100, False, 0.2),
+        ("median_household_income", 0, 1, 1000, 100, False, 0.2),
+        ("dual_income_rate", 0, 1, 1, 100, False, 0.2),
+        ("family_household_rate", 0, 1, 1, 100, False, 0.2),
+        ("birth_rate", 0, 5, 1, 100, False, 0.2),
+    ],
+    "competition": [
+        ("market_saturation_index", 0, 20, 1, 100, True, 0.35),
+        ("market_gap_score", 50, 1, 1, _INF, False, 0.35),
+        ("competitive_intensity_score", 0, 1, 1, 100, True, 0.3),
+    ],
+    "accessibility": [
+        ("transit_score", 50, 1, 1, _INF, False, 0.3),
+        ("morning_rush_score", 50, 1, 1, _INF, False, 0.3),
+        ("parking_availability_score", 50, 1, 1, _INF, False, 0.2),
+        ("highway_visibility_score", 50, 1, 1, _INF, False, 0.2),
+    ],
+    "safety": [
+        ("crime_rate_index", 30, 1, 1, _INF, True, 0.3),
+        ("pedestrian_safety_score", 70, 1, 1, _INF, False, 0.2),
+        ("air_quality_index", 50, 1, 2, 100, True, 0.2),
+        ("neighborhood_safety_perception", 60, 1, 1, _INF, False, 0.3),
+    ],
+    "economic": [
+        ("real_estate_cost_per_sqft", 150, 1, 4, 100, True, 0.3),
+        ("childcare_worker_availability_score", 60, 1, 1, _INF, False, 0.3),
+        ("business_incentives_score", 50, 1, 1, _INF, False, 0.2),
+        ("economic_growth_indicator", 55, 1, 1, _INF, False, 0.2),
+    ],
+    "regulatory": [
+        ("zoning_compliance_score", 60, 1, 1, _INF, False, 0.4),
+        ("rezoning_feasibility_score", 65, 1, 1, _INF, False, 0.2),
+        ("building_code_complexity_score", 55, 1, 1, 100, True, 0.2),
+        ("licensing_difficulty_score", 55, 1, 1, 100, True, 0.2),
+    ],
+}
+
+# Overall weighted score; a category with no data counts as 0
+_OVERALL_CATEGORIES = ("demographics", "competition", "accessibility", "safety", "economic", "regulatory")
+_OVERALL_WEIGHTS = np.array([0.25, 0.20, 0.15, 0.20, 0.10, 0.10])
+
+
+def _make_scorer(spec: List[tuple]):
+    """Compile one category's spec into a scorer over prebuilt NumPy arrays"""
+    keys, defaults, multipliers, divisors, caps, inverts, weights = zip(*spec)
+    lookups = tuple(zip(keys, defaults))
+    multipliers = np.array(multipliers, dtype=np.float64)
+    divisors = np.array(divisors, dtype=np.float64)
+    caps = np.array(caps, dtype=np.float64)
+    inverts = np.array(inverts, dtype=bool)
+    weights = np.array(weights, dtype=np.float64)
+    
+    def score(data: Dict[str, Any]) -> float:
+        vals = np.fromiter((data.get(k, d) for k, d in lookups), dtype=np.float64, count=len(lookups))
+        terms = np.minimum(caps, vals * multipliers / divisors)
+        terms = np.where(inverts, 100.0 - terms, terms)
+        # Element-wise product then sum keeps the left-to-right accumulation
+        # of the hand-written formulas, so rounding matches them exactly
+        return round(float((terms * weights).sum()), 1)
+    
+    return score
+
+
+_CATEGORY_SCORERS = {category: _make_scorer(spec) for category, spec in _SCORE_SPEC.items()}
+
+
 def _calculate_scores(results: dict) -> dict:
     """Calculate category scores (0-100)"""
     
     scores = {}
-    
-    # Demographics
-    demo = results.get("demographics", {})
-    if demo:
-        demo_score = (
-            min(100, demo.get("population_density", 0) / 10) * 0.2 +
-            min(100, demo.get("median_household_income", 0) / 1000) * 0.2 +
-            min(100, demo.get("dual_income_rate", 0)) * 0.2 +
-            min(100, demo.get("family_household_rate", 0)) * 0.2 +
-            min(100, demo.get("birth_rate", 0) * 5) * 0.2
-        )
-        scores["demographics"] = round(demo_score, 1)
-    
-    # Competition
-    comp = results.get("competition", {})
-    if comp:
-        comp_score = (
-            (100 - min(100, comp.get("market_saturation_index", 0) * 20)) * 0.35 +
-            comp.get("market_gap_score", 50) * 0.35 +
-            (100 - min(100, comp.get("competitive_intensity_score", 0))) * 0.3
-        )
-        scores["competition"] = round(comp_score, 1)
-    
-    # Accessibility
-    acc = results.get("accessibility", {})
-    if acc:
-        acc_score = (
-            acc.get("transit_score", 50) * 0.3 +
-            acc.get("morning_rush_score", 50) * 0.3 +
-            acc.get("parking_availability_score", 50) * 0.2 +
-            acc.get("highway_visibility_score", 50) * 0.2
-        )
-        scores["accessibility"] = round(acc_score, 1)
-    
-    # Safety
-    safe = results.get("safety", {})
-    if safe:
-        safe_score = (
-            (100 - safe.get("crime_rate_index", 30)) * 0.3 +
-            safe.get("pedestrian_safety_score", 70) * 0.2 +
-            (100 - min(100, safe.get("air_quality_index", 50) / 2)) * 0.2 +
-            safe.get("neighborhood_safety_perception", 60) * 0.3
-        )
-        scores["safety"] = round(safe_score, 1)
-    
-    # Economic
-    econ = results.get("economic", {})
-    if econ:
-        econ_score = (
-            (100 - min(100, econ.get("real_estate_cost_per_sqft", 150) / 4)) * 0.3 +
-            econ.get("childcare_worker_availability_score", 60) * 0.3 +
-            econ.get("business_incentives_score", 50) * 0.2 +
-            econ.get("economic_growth_indicator", 55) * 0.2
-        )
-        scores["economic"] = round(econ_score, 1)
-    
-    # Regulatory
-    reg = results.get("regulatory", {})
-    if reg:
-        reg_score = (
-            reg.get("zoning_compliance_score", 60) * 0.4 +
-            reg.get("rezoning_feasibility_score", 65) * 0.2 +
-            (100 - min(100, reg.get("building_code_complexity_score", 55))) * 0.2 +
-            (100 - min(100, reg.get("licensing_difficulty_score", 55))) * 0.2
-        )
-        scores["regulatory"] = round(reg_score, 1)
+    for category, scorer in _CATEGORY_SCORERS.items():
+        data = results.get(category, {})
+        if data:
+            scores[category] = scorer(data)
     
     # Overall weighted score
-    weights = {"demographics": 0.25, "competition": 0.20, "accessibility": 0.15,
-               "safety": 0.20, "economic": 0.10, "regulatory": 0.10}
-    
-    weighted_sum = sum(scores.get(cat, 0) * weight for cat, weight in weights.items())
-    scores["overall"] = round(weighted_sum, 1)
+    category_scores = np.fromiter(
+        (scores.get(category, 0) for category in _OVERALL_CATEGORIES),
+        dtype=np.float64,
+        count=len(_OVERALL_CATEGORIES)
+    )
+    scores["overall"] = round(float((category_scores * _OVERALL_WEIGHTS).sum()), 1)
     
     return scores
 
 
+def _rule_based_explanations(
+    categories: Dict[str, Dict[str, Any]],
+    scored: List[tuple]
+) -> Dict[str, Dict[str, Any]]:
+    """DataPointExplainer category explanations for each (category, score)"""
+    explanations = {}
+    for cat_name, score in scored:
+        try:
+            explanations[cat_name] = DataPointExplainer.generate_category_explanation(
+                category=cat_name,
+                data_points=categories[cat_name],
+                score=score
+            )
+        except Exception as e:
+            logger.warning("Could not generate explanation for %s: %s", cat_name, e)
+            explanations[cat_name] = {
+                "interpretation": "Explanation not available",
+                "recommendation": "Review detailed metrics for this category"
+            }
+    return explanations
+
+
+def _add_data_point_explanations(
+    categories: Dict[str, Dict[str, Any]],
+    data_point_keys: Dict[str, List[str]]
+):
+    """Add a ``<key>_explanation`` entry next to each listed data point"""
+    for cat_name, keys in data_point_keys.items():
+        try:
+            for key in keys:
+                value = categories[cat_name][key]
+                try:
+                    dp_explanation = DataPointExplainer.explain_data_point(
+                        category=cat_name,
+                        data_point_name=key,
+                        value=value,
+                        raw_data=categories[cat_name]
+                    )
+                    if dp_explanation:
+                        # Add explanation as nested object for this data point
+                        categories[cat_name][f"{key}_explanation"] = dp_explanation
+                except Exception as e:
+                    logger.warning("Could not generate explanation for %s.%s: %s", cat_name, key, e)
+        except Exception:
+            logger.exception("Could not generate data point explanations for %s", cat_name)
+
+
 async def collect_data_parallel(
     address: str,
     radius_miles: float,
@@ -428,7 +648,7 @@ async def collect_data_parallel(
     def safe_data(data, default=None):
         """Return data if valid, otherwise default"""
         if isinstance(data, Exception):
-            print(f"Collector error: {data}")
+            logger.warning("Collector error: %s", data)
             return default or {"error": str(data), "metrics": {}, "score": 0}
         return data or {"error": "No data", "metrics": {}, "score": 0}
     
@@ -472,90 +692,45 @@ async def collect_data_parallel(
     scores = _calculate_scores(categories)
     
     # Add scores, metrics, and explanations to each category
-    # Define metadata fields to exclude from counting
-    metadata_fields = {
-        "success", "address", "coordinates", "data_source", "note", "score", 
-        "radius_miles", "collection_time_ms", "metrics_count", "explanation",
-        "error", "metrics", "search_radius_miles", "centers_analyzed",
-        "total_population", "land_area_sqmi", "jurisdiction", "state",
-        "centers_details", "centers_analyzed", "data_source_details"
-    }
+    scored = [
+        (cat_name, score) for cat_name, score in scores.items()
+        if cat_name in categories and cat_name != "overall"
+    ]
     
-    for cat_name, score in scores.items():
-        if cat_name in categories and cat_name != "overall":
-            categories[cat_name]["score"] = score
-            
-            # Count actual data metrics (excluding metadata and _explanation keys)
-            # Only count keys with scalar values (numbers, strings, booleans)
-            try:
-                metrics_count = 0
-                for k in categories[cat_name].keys():
-                    if k not in metadata_fields and not k.endswith("_explanation"):
-                        val = categories[cat_name][k]
-                        # Count only scalar values (not dicts, lists, etc.)
-                        if isinstance(val, (int, float, str, bool)):
-                            metrics_count += 1
-                categories[cat_name]["metrics_count"] = metrics_count
-                print(f"Category {cat_name}: {metrics_count} metrics counted")
-            except Exception as e:
-                print(f"Error counting metrics for {cat_name}: {e}")
-                categories[cat_name]["metrics_count"] = 0
-            
-            # Generate AI explanation for this category
-            # Use OpenAI if available, otherwise fall back to rule-based
-            try:
-                if openai_client:
-                    # Use ChatGPT for dynamic AI explanations
-                    explanation = await generate_ai_explanation_openai(
-                        category=cat_name,
-                        data=categories[cat_name],
-                        score=score
-                    )
-                else:
-                    # Fall back to rule-based explanations
-                    explanation = DataPointExplainer.generate_category_explanation(
-                        category=cat_name,
-                        data_points=categories[cat_name],
-                        score=score
-                    )
-                categories[cat_name]["explanation"] = explanation
-            except Exception as e:
-                print(f"Warning: Could not generate explanation for {cat_name}: {e}")
-                import traceback
-                traceback.print_exc()
-                categories[cat_name]["explanation"] = {
-                    "interpretation": "Explanation not available",
-                    "recommendation": "Review detailed metrics for this category"
-                }
-            
-            # Add data point explanations for each metric in the category
-            try:
-                # Get list of data point keys first to avoid modifying dict during iteration
-                data_point_keys = []
-                for k in categories[cat_name].keys():
-                    if k not in metadata_fields and not k.endswith("_explanation"):
-                        val = categories[cat_name][k]
-                        if isinstance(val, (int, float, str, bool)):
-                            data_point_keys.append(k)
-                
-                for key in data_point_keys:
-                    value = categories[cat_name][key]
-                    try:
-                        dp_explanation = DataPointExplainer.explain_data_point(
-                            category=cat_name,
-                            data_point_name=key,
-                            value=value,
-                            raw_data=categories[cat_name]
-                        )
-                        if dp_explanation:
-                            # Add explanation as nested object for this data point
-                            categories[cat_name][f"{key}_explanation"] = dp_explanation
-                    except Exception as e:
-                        print(f"Warning: Could not generate explanation for {cat_name}.{key}: {e}")
-            except Exception as e:
-                print(f"Warning: Could not generate data point explanations for {cat_name}: {e}")
-                import traceback
-                traceback.print_exc()
+    # Data point keys per category, found in the same scan that counts them
+    data_point_keys = {}
+    
+    for cat_name, score in scored:
+        categories[cat_name]["score"] = score
+        
+        # Count actual data metrics (excluding metadata and _explanation keys)
+        # Only count keys with scalar values (numbers, strings, booleans)
+        try:
+            data_point_keys[cat_name] = [
+                k for k, val in categories[cat_name].items()
+                if isinstance(val, _SCALAR_TYPES) and _is_metric_key(k)
+            ]
+            categories[cat_name]["metrics_count"] = len(data_point_keys[cat_name])
+        except Exception as e:
+            logger.warning("Error counting metrics for %s: %s", cat_name, e)
+            data_point_keys[cat_name] = []
+            categories[cat_name]["metrics_count"] = 0
+    
+    # Generate AI explanations for all categories in a single OpenAI request
+    # Use OpenAI if available, otherwise fall back to rule-based
+    if openai_client:
+        explanations = await generate_ai_explanations_batch({
+            cat_name: {"score": score, "data": categories[cat_name]}
+            for cat_name, score in scored
+        })
+    else:
+        # Rule-based explanations are pure Python; keep them off the event loop
+        explanations = await asyncio.to_thread(_rule_based_explanations, categories, scored)
+    for cat_name, _ in scored:
+        categories[cat_name]["explanation"] = explanations[cat_name]
+    
+    # Add data point explanations for each metric, all in one worker thread
+    await asyncio.to_thread(_add_data_point_explanations, categories, data_point_keys)
     
     overall_score = scores.get("overall", 0)
     
@@ -567,16 +742,13 @@ async def collect_data_parallel(
     )
     
     # Additional data points from specialized collectors
-    if epa_data and not isinstance(epa_data.get("error"), str):
-        data_points_collected += len(epa_data.get("metrics", {}))
-    if hud_data and not isinstance(hud_data.get("error"), str):
-        data_points_collected += len(hud_data.get("metrics", {}))
-    if fbi_data and not isinstance(fbi_data.get("error"), str):
-        data_points_collected += len(fbi_data.get("metrics", {}))
-    if fema_data and not isinstance(fema_data.get("error"), str):
-        data_points_collected += len(fema_data.get("metrics", {}))
+    for extra_data in (epa_data, hud_data, fbi_data, fema_data):
+        if extra_data and not isinstance(extra_data.get("error"), str):
+            extra_metrics = extra_data.get("metrics")
+            if extra_metrics:
+                data_points_collected += len(extra_metrics)
     
-    return {
+    result = {
         "address": corrected_address,
         "original_address": address,
         "overall_score": round(overall_score, 1),
@@ -589,11 +761,15 @@ async def collect_data_parallel(
         },
         "data_points_collected": data_points_collected,
         "address_validation": address_info,
-        "analysis_timestamp": datetime.now().isoformat(),
-        # Debug info
-        "_debug_demographics_keys": list(categories.get("demographics", {}).keys()) if isinstance(categories.get("demographics"), dict) else [],
-        "_debug_demographics_metrics_count": categories.get("demographics", {}).get("metrics_count", "NOT SET")
+        "analysis_timestamp": datetime.now().isoformat()
     }
+    
+    # Debug info
+    if settings.debug:
+        result["_debug_demographics_keys"] = list(categories.get("demographics", {}).keys()) if isinstance(categories.get("demographics"), dict) else []
+        result["_debug_demographics_metrics_count"] = categories.get("demographics", {}).get("metrics_count", "NOT SET")
+    
+    return result
 
 
 @app.get("/")
@@ -604,20 +780,41 @@ async def home(request: Request):
     return HTMLResponse("<h1>Brightspot Locator AI - Optimized</h1><p>Use /api/v1/analyze endpoint</p>")
 
 
+# Per-(address, radius) locks so concurrent identical requests run the
+# analysis once; the rest wait for it and are served from the cache
+_analyze_locks: Dict[tuple, asyncio.Lock] = {}
+
+
 async def analyze_location_internal(address: str, radius_miles: float = 3.0) -> Dict[str, Any]:
     """
     Internal analysis function with caching and database storage
     Used by both single and batch endpoints
     """
-    start_time = time.time()
-    tracker = PerformanceTracker()
-    
     # Check cache first
     cached_result = redis_cache.get(address, radius_miles)
     if cached_result:
-        cached_result["cached"] = True
-        cached_result["cache_hit"] = True
-        return cached_result
+        # A copy: the in-memory fallback cache hands out its stored dict
+        return {**cached_result, "cached": True, "cache_hit": True}
+    
+    # Same normalization as the cache key
+    key = (address.lower(), radius_miles)
+    lock = _analyze_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            # Another request may have filled the cache while we waited
+            cached_result = redis_cache.get(address, radius_miles)
+            if cached_result:
+                return {**cached_result, "cached": True, "cache_hit": True}
+            return await _analyze_uncached(address, radius_miles)
+    finally:
+        if _analyze_locks.get(key) is lock and not lock.locked():
+            del _analyze_locks[key]
+
+
+async def _analyze_uncached(address: str, radius_miles: float) -> Dict[str, Any]:
+    """Run the analysis, then cache it and queue it for the database"""
+    start_time = time.time()
+    tracker = PerformanceTracker()
     
     # Collect all data in parallel
     result = await collect_data_parallel(address, radius_miles, tracker)
@@ -636,23 +833,41 @@ async def analyze_location_internal(address: str, radius_miles: float = 3.0) ->
     # Cache result
     redis_cache.set(address, radius_miles, result)
     
-    # Save to database (async, don't wait)
-    try:
-        database.save_analysis(
-            address=address,
-            response=result,
-            persona="business",
-            execution_time=total_time,
-            status="completed"
-        )
-    except Exception as e:
-        print(f"Database save failed: {e}")
+    # Save to database (batched in the background, don't wait)
+    analysis = {
+        "address": address,
+        "response": result,
+        "persona": "business",
+        "execution_time": total_time,
+        "status": "completed"
+    }
+    queue = getattr(app.state, "save_queue", None)
+    if queue is not None:
+        queue.put_nowait(analysis)
+    else:
+        # No writer running (lifespan not started, or shutting down)
+        try:
+            await asyncio.to_thread(database.save_analysis, **analysis)
+        except Exception as e:
+            logger.error("Database save failed: %s", e)
     
     return result
 
 
+class AnalyzeRequest(BaseModel):
+    """Single-address analysis request; validated by pydantic-core before the handler runs"""
+    address: str = Field("", description="Street address to analyze")
+    radius_miles: float = Field(3.0, description="Search radius around the address")
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Multi-address analysis request"""
+    addresses: List[str] = Field(default_factory=list, description="Street addresses to analyze (max 50)")
+    radius: float = Field(3.0, description="Search radius around each address")
+
+
 @app.post("/api/v1/analyze")
-async def analyze_location(request: Request):
+async def analyze_location(body: AnalyzeRequest):
     """
     Enterprise analysis endpoint with:
     - Redis caching for instant responses
@@ -660,25 +875,20 @@ async def analyze_location(request: Request):
     - Circuit breaker protection
     - Parallel data collection
     """
+    # Kept as a 400 (not a 422 from the model) for existing clients
+    if not body.address:
+        raise HTTPException(status_code=400, detail="Address is required")
+    
     try:
-        body = await request.json()
-        address = body.get("address", "")
-        radius_miles = body.get("radius_miles", 3.0)
-        
-        if not address:
-            raise HTTPException(status_code=400, detail="Address is required")
-        
         # Analyze with all enterprise features
-        result = await analyze_location_internal(address, radius_miles)
+        result = await analyze_location_internal(body.address, body.radius_miles)
         
-        return JSONResponse(content=result)
+        return ORJSONResponse(content=result)
         
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Analysis error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Analysis error")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
@@ -698,7 +908,8 @@ async def health_check():
             "redis_caching": redis_healthy,
             "database_storage": True,
             "circuit_breakers": True,
-            "batch_analysis": True
+            "batch_analysis": True,
+            "uvloop": type(asyncio.get_running_loop()).__module__.startswith("uvloop")
         },
         "cache": redis_cache.get_stats(),
         "database": database.get_statistics(),
@@ -786,7 +997,7 @@ async def get_location_trends(
 
 
 @app.post("/api/v1/analyze/batch")
-async def analyze_batch(request: Request):
+async def analyze_batch(body: BatchAnalyzeRequest):
     """
     Batch analysis endpoint - analyze multiple locations in parallel
     
@@ -796,17 +1007,16 @@ async def analyze_batch(request: Request):
         "radius": 3.0
     }
     """
+    addresses = body.addresses
+    radius = body.radius
+    
+    if not addresses:
+        raise HTTPException(status_code=400, detail="No addresses provided")
+    
+    if len(addresses) > 50:
+        raise HTTPException(status_code=400, detail="Maximum 50 addresses allowed")
+    
     try:
-        data = await request.json()
-        addresses = data.get("addresses", [])
-        radius = data.get("radius", 3.0)
-        
-        if not addresses:
-            raise HTTPException(status_code=400, detail="No addresses provided")
-        
-        if len(addresses) > 50:
-            raise HTTPException(status_code=400, detail="Maximum 50 addresses allowed")
-        
         # Analyze all addresses in parallel
         tasks = [
             analyze_location_internal(addr, radius)
@@ -895,13 +1105,21 @@ if __name__ == "__main__":
     print("   ✅ Parallel API data collection (10x faster)")
     print("   ✅ Connection pooling (reuse connections)")
     print("   ✅ GZip compression (smaller responses)")
+    print("   ✅ uvloop + httptools, one worker per core")
     print("   ✅ Graceful error handling (no cascading failures)")
     print("\n⚠️  IMPORTANT: Using REAL APIs - requires valid API keys in .env file")
     print("="*80 + "\n")
     
+    # C event loop and HTTP parser, one worker per core; workers are recycled
+    # after 10k requests to cap slow memory growth. The in-memory cache
+    # fallback and the database writer are per worker.
     uvicorn.run(
-        app,
+        "production_server_optimized:app",
         host="127.0.0.1",
         port=9025,
-        log_level="info"
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=os.cpu_count() or 1,
+        limit_max_requests=10_000,
+        log_level="warning"  # no per-request access log lines
     )
@@ -6,7 +6,7 @@ Replaces in-memory cache with Redis backend
 import redis
 import json
 import hashlib
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import timedelta
 import logging
 
@@ -114,6 +114,52 @@ class RedisCache:
         except Exception as e:
             logger.error(f"Redis SET error: {e}")
     
+    def get_raw_many(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieve values stored under caller-built keys (see ``set_raw_many``)
+        with a single MGET round trip
+        
+        Returns:
+            One entry per key, None where nothing is cached
+        """
+        if not keys:
+            return []
+        
+        if not self.enabled:
+            return [self.fallback_cache.get(key) for key in keys]
+        
+        try:
+            return [json.loads(data) if data else None for data in self.client.mget(keys)]
+        except Exception as e:
+            logger.error(f"Redis MGET error: {e}")
+            return [None] * len(keys)
+    
+    def set_raw_many(self, values: Dict[str, Dict[str, Any]], ttl_hours: Optional[int] = None):
+        """
+        Store values under caller-built keys instead of (address, radius)
+        pairs, pipelined into one round trip
+        
+        Args:
+            values: Full cache key (namespaced by the caller, e.g. "aiexp:...")
+                to JSON-serializable data
+            ttl_hours: Override default TTL
+        """
+        if not values:
+            return
+        
+        if not self.enabled:
+            self.fallback_cache.update(values)
+            return
+        
+        try:
+            ttl = timedelta(hours=ttl_hours) if ttl_hours else self.ttl
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                pipe.setex(key, ttl, json.dumps(value))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis SET error: {e}")
+    
     def delete(self, address: str, radius: float) -> bool:
         """Delete specific cache entry"""
         key = self._make_key(address, radius)
@@ -155,8 +201,12 @@ class RedisCache:
             }
         
         try:
-            info = self.client.info("stats")
-            keys = self.client.keys("analysis:*")
+            # One round trip for all three lookups
+            pipe = self.client.pipeline(transaction=False)
+            pipe.info("stats")
+            pipe.keys("analysis:*")
+            pipe.info("memory")
+            info, keys, memory = pipe.execute()
             
             return {
                 "enabled": True,
@@ -165,7 +215,7 @@ class RedisCache:
                 "keyspace_hits": info.get("keyspace_hits", 0),
                 "keyspace_misses": info.get("keyspace_misses", 0),
                 "hit_rate": self._calculate_hit_rate(info),
-                "memory_usage": self.client.info("memory").get("used_memory_human", "N/A"),
+                "memory_usage": memory.get("used_memory_human", "N/A"),
                 "connected_clients": info.get("connected_clients", 0)
             }
         except Exception as e: